@@ -3,12 +3,18 @@
 Loads and validates asset metadata from assets/manifest.yaml.
 """
 
+import functools
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class AssetMetadata:
@@ -24,7 +30,12 @@ class AssetMetadata:
 
 
 class AssetManifest:
-    """Parses and validates asset manifest."""
+    """Parses and validates asset manifest.
+
+    The parsed data and its sections are exposed as read-only mappings, so the asset
+    lists derived from them can be computed once. Individual asset entries are shared
+    with those lists and must not be modified either.
+    """
 
     def __init__(self, manifest_path: str) -> None:
         """Load and parse the asset manifest.
@@ -40,12 +51,79 @@ class AssetManifest:
             raise FileNotFoundError(f"Manifest not found: {manifest_path}")
 
         with open(manifest_path) as f:
-            self.data: dict[str, Any] = yaml.safe_load(f) or {}
+            data: dict[str, Any] = yaml.load(f, Loader=_YAML_LOADER) or {}
+
+        self._data: Mapping[str, Any] = MappingProxyType(data)
+        self._images: Mapping[str, Any] = MappingProxyType(data.get("images", {}))
+        self._audio: Mapping[str, Any] = MappingProxyType(data.get("audio", {}))
+        self._source: Mapping[str, Any] = MappingProxyType(data.get("source", {}))
+        self.version: str = data.get("version", "unknown")
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """Whole parsed manifest (read-only)."""
+        return self._data
+
+    @property
+    def images(self) -> Mapping[str, Any]:
+        """Image entries by name (read-only)."""
+        return self._images
+
+    @property
+    def audio(self) -> Mapping[str, Any]:
+        """Audio entries by name (read-only)."""
+        return self._audio
+
+    @property
+    def source(self) -> Mapping[str, Any]:
+        """Source media entries by name (read-only)."""
+        return self._source
+
+    @functools.cached_property
+    def _entries(self) -> tuple[tuple[str, bool], ...]:
+        """(path, tracked) pairs for every asset entry, walked once."""
+        entries = []
+        for section in (self.images, self.audio, self.source):
+            for asset in section.values():
+                if isinstance(asset, dict):
+                    path = asset.get("path", "")
+                    if path:
+                        entries.append((path, bool(asset.get("tracked"))))
+        return tuple(entries)
+
+    @functools.cached_property
+    def _index(self) -> dict[str, dict[str, Any]]:
+        """Flat name -> metadata index across all sections, built once."""
+        index: dict[str, dict[str, Any]] = {}
+        for section in (self.images, self.audio, self.source):
+            for name, asset in section.items():
+                if isinstance(asset, dict):
+                    index.setdefault(name, asset)
+        return index
+
+    @functools.cached_property
+    def _paths(self) -> tuple[str, ...]:
+        return tuple(path for path, _ in self._entries)
+
+    @functools.cached_property
+    def _tracked(self) -> tuple[str, ...]:
+        return tuple(path for path, tracked in self._entries if tracked)
+
+    @functools.cached_property
+    def _ignored(self) -> tuple[str, ...]:
+        return tuple(path for path, tracked in self._entries if not tracked)
+
+    def get_asset(self, name: str) -> dict[str, Any]:
+        """Get metadata for an asset by name, regardless of section.
+
+        Args:
+            name: Asset key, e.g. "kitten" or "meow".
 
-        self.version: str = self.data.get("version", "unknown")
-        self.images: dict[str, Any] = self.data.get("images", {})
-        self.audio: dict[str, Any] = self.data.get("audio", {})
-        self.source: dict[str, Any] = self.data.get("source", {})
+        Returns:
+            The asset's metadata dict, or an empty dict if not found. When a
+            name appears in several sections, images win over audio over source.
+        """
+        return self._index.get(name, {})
 
     def get_asset_paths(self) -> list[str]:
         """Get all asset paths from manifest.
@@ -53,17 +131,7 @@ class AssetManifest:
         Returns:
             List of relative asset paths.
         """
-        paths = []
-        for asset in self.images.values():
-            if isinstance(asset, dict):
-                paths.append(asset.get("path", ""))
-        for asset in self.audio.values():
-            if isinstance(asset, dict):
-                paths.append(asset.get("path", ""))
-        for asset in self.source.values():
-            if isinstance(asset, dict):
-                paths.append(asset.get("path", ""))
-        return [p for p in paths if p]
+        return list(self._paths)
 
     def get_tracked_assets(self) -> list[str]:
         """Get paths of all tracked assets.
@@ -71,17 +139,7 @@ class AssetManifest:
         Returns:
             List of tracked asset paths.
         """
-        tracked = []
-        for asset in self.images.values():
-            if isinstance(asset, dict) and asset.get("tracked"):
-                tracked.append(asset.get("path", ""))
-        for asset in self.audio.values():
-            if isinstance(asset, dict) and asset.get("tracked"):
-                tracked.append(asset.get("path", ""))
-        for asset in self.source.values():
-            if isinstance(asset, dict) and asset.get("tracked"):
-                tracked.append(asset.get("path", ""))
-        return [p for p in tracked if p]
+        return list(self._tracked)
 
     def get_ignored_assets(self) -> list[str]:
         """Get paths of all ignored assets.
@@ -89,17 +147,7 @@ class AssetManifest:
         Returns:
             List of ignored asset paths.
         """
-        ignored = []
-        for asset in self.images.values():
-            if isinstance(asset, dict) and not asset.get("tracked"):
-                ignored.append(asset.get("path", ""))
-        for asset in self.audio.values():
-            if isinstance(asset, dict) and not asset.get("tracked"):
-                ignored.append(asset.get("path", ""))
-        for asset in self.source.values():
-            if isinstance(asset, dict) and not asset.get("tracked"):
-                ignored.append(asset.get("path", ""))
-        return [p for p in ignored if p]
+        return list(self._ignored)
 
     def validate_assets(self, assets_root: str) -> tuple[bool, list[str]]:
         """Validate that all tracked assets exist on disk.
@@ -34,7 +34,9 @@ class AssetLoader:
         logger.debug(f"Music directory: {self.music_dir}")
         logger.debug(f"Source directory: {self.source_dir}")
 
-        pyglet.resource.path = [self.script_dir, self.assets_dir]
+        # Deduplicated, immutable copy of the search path for callers to inspect
+        self.resource_path: tuple[str, ...] = tuple(dict.fromkeys([self.script_dir, self.assets_dir]))
+        pyglet.resource.path = list(self.resource_path)
         pyglet.resource.reindex()
         logger.info("AssetLoader initialized successfully")
 
@@ -1,7 +1,7 @@
 """Game configuration with typed constants.
 
-All magic numbers and configuration values are centralized here as a frozen dataclass
-to enable easy testing, configuration management, and entity system integration.
+All magic numbers and configuration values are centralized here as class-level
+constants to enable easy testing, configuration management, and entity system integration.
 """
 
 import functools
@@ -14,6 +14,10 @@ class GameConfig:
 
     Uses standard attributes for simple scalars (low overhead) and
     functools.cached_property for objects or computed values (lazy loading).
+
+    Scalars live on the class, so instances carry no per-field storage; the
+    instance ``__dict__`` only holds colors once they are first accessed, which
+    is why the class is not slotted.
     """
 
     # Window Configuration
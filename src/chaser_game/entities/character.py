@@ -20,6 +20,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Derived speeds, fixed for the lifetime of CONFIG
+MOUSE_SPEED = CONFIG.WINDOW_WIDTH / CONFIG.WINDOW_TRAVERSAL_TIME
+KITTEN_SPEED = MOUSE_SPEED / CONFIG.KITTEN_SPEED_FACTOR
+
 
 class CharacterState(Enum):
     """Character movement state."""
@@ -47,8 +51,28 @@ class Character:
 
     Manages position (center-based), velocity, state, and provides
     update/draw/input interfaces.
+
+    Attributes are declared in ``__slots__`` so per-frame reads and writes of
+    position and velocity skip the instance ``__dict__``. Half extents are kept
+    alongside ``width`` and ``height`` so the per-frame clamp does not re-halve them.
     """
 
+    __slots__ = (
+        "center_x",
+        "center_y",
+        "_width",
+        "_height",
+        "_half_width",
+        "_half_height",
+        "velocity_x",
+        "velocity_y",
+        "state",
+        "health",
+        "stamina",
+        "_prev_x",
+        "_prev_y",
+    )
+
     def __init__(
         self,
         center_x: float,
@@ -91,6 +115,26 @@ class Character:
             f"{self.__class__.__name__} created at ({center_x}, {center_y}), size: {width}x{height}"
         )
 
+    @property
+    def width(self) -> float:
+        """Character sprite width."""
+        return self._width
+
+    @width.setter
+    def width(self, value: float) -> None:
+        self._width = value
+        self._half_width = value / 2
+
+    @property
+    def height(self) -> float:
+        """Character sprite height."""
+        return self._height
+
+    @height.setter
+    def height(self, value: float) -> None:
+        self._height = value
+        self._half_height = value / 2
+
     def get_data(self) -> CharacterData:
         """Get immutable snapshot of character state.
 
@@ -114,8 +158,8 @@ class Character:
             window_width: Window width in pixels.
             window_height: Window height in pixels.
         """
-        half_width = self.width / 2
-        half_height = self.height / 2
+        half_width = self._half_width
+        half_height = self._half_height
         self.center_x = max(half_width, min(window_width - half_width, self.center_x))
         self.center_y = max(half_height, min(window_height - half_height, self.center_y))
 
@@ -141,19 +185,23 @@ class Character:
             window_width: Window width for bounds checking.
             window_height: Window height for bounds checking.
         """
-        # Store previous position for distance tracking
-        self._prev_x = self.center_x
-        self._prev_y = self.center_y
+        x = self.center_x
+        y = self.center_y
+        vx = self.velocity_x
+        vy = self.velocity_y
+        half_width = self._half_width
+        half_height = self._half_height
 
-        # Update position based on velocity
-        self.center_x += self.velocity_x * dt
-        self.center_y += self.velocity_y * dt
+        # Store previous position for distance tracking
+        self._prev_x = x
+        self._prev_y = y
 
-        # Clamp to bounds
-        self.clamp_to_bounds(window_width, window_height)
+        # Update position based on velocity, clamped to bounds
+        self.center_x = max(half_width, min(window_width - half_width, x + vx * dt))
+        self.center_y = max(half_height, min(window_height - half_height, y + vy * dt))
 
         # Update state based on velocity
-        if self.velocity_x == 0.0 and self.velocity_y == 0.0:
+        if vx == 0.0 and vy == 0.0:
             self.state = CharacterState.IDLE
         else:
             self.state = CharacterState.MOVING
@@ -184,6 +232,8 @@ class Mouse(Character):
     Responds to keyboard and mouse input, tracks distance traveled.
     """
 
+    __slots__ = ("sprite", "total_distance")
+
     def __init__(
         self,
         center_x: float,
@@ -236,7 +286,7 @@ class Mouse(Character):
 
         if length > 0:
             # Normalize and apply speed
-            speed = CONFIG.WINDOW_WIDTH / CONFIG.WINDOW_TRAVERSAL_TIME
+            speed = MOUSE_SPEED
             self.velocity_x = (dx / length) * speed
             self.velocity_y = (dy / length) * speed
         else:
@@ -255,9 +305,9 @@ class Mouse(Character):
         """
         from pyglet.window import key
 
-        # Calculate base speed using configured window width
+        # Base speed derived from configured window width
         # (Consistent with pre-refactor logic using window.width, assuming non-resizable or config-based logic)
-        base_speed = CONFIG.WINDOW_WIDTH / CONFIG.WINDOW_TRAVERSAL_TIME
+        base_speed = MOUSE_SPEED
 
         if symbol == key.UP:
             self.velocity_x = 0.0
@@ -358,6 +408,8 @@ class Kitten(Character):
     Automatically chases the mouse, with configurable speed and behavior.
     """
 
+    __slots__ = ("image", "speed", "was_moving")
+
     def __init__(
         self,
         center_x: float,
@@ -377,7 +429,7 @@ class Kitten(Character):
         """
         super().__init__(center_x, center_y, width, height)
         self.image = image
-        self.speed = CONFIG.WINDOW_WIDTH / CONFIG.WINDOW_TRAVERSAL_TIME / CONFIG.KITTEN_SPEED_FACTOR
+        self.speed = KITTEN_SPEED
         self.was_moving = False  # Track movement state for sound effects
         logger.debug(f"Kitten created at ({center_x}, {center_y}), speed: {self.speed:.1f}")
 
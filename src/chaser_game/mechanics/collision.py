@@ -2,8 +2,6 @@
 
 from typing import Protocol
 
-from ..movement import distance
-
 
 class BoundedEntity(Protocol):
     """Protocol for entities that can be clamped to bounds."""
@@ -51,5 +49,7 @@ def check_catch_condition(
     Returns:
         True if kitten has caught the mouse, False otherwise.
     """
-    dist = distance(mouse.center_x, mouse.center_y, kitten.center_x, kitten.center_y)
-    return dist < catch_range
+    # Compare squared distances to skip the sqrt on this per-frame check
+    dx = kitten.center_x - mouse.center_x
+    dy = kitten.center_y - mouse.center_y
+    return catch_range > 0.0 and dx * dx + dy * dy < catch_range * catch_range
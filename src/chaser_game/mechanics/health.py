@@ -1,9 +1,9 @@
 """Health and stamina management system."""
 
+import math
 from typing import Protocol
 
 from ..config import CONFIG
-from ..movement import distance
 
 
 class HealthEntity(Protocol):
@@ -48,18 +48,27 @@ def update_health_stamina(
         catch_range: Maximum distance for health transfer.
         dt: Time elapsed in seconds.
     """
-    # Calculate distance between sprite centers
-    dist = distance(mouse.center_x, mouse.center_y, kitten.center_x, kitten.center_y)
+    # Squared distance between sprite centers; the sqrt is only needed in range
+    dx = kitten.center_x - mouse.center_x
+    dy = kitten.center_y - mouse.center_y
+    dist_sq = dx * dx + dy * dy
+
+    # Out of range only the passive drain applies, but both values are still clamped
+    if catch_range <= 0.0 or dist_sq >= catch_range * catch_range:
+        stamina = kitten.stamina - CONFIG.PASSIVE_STAMINA_DRAIN * dt
+        kitten.stamina = max(0.0, min(CONFIG.MAX_STAMINA, stamina))
+        mouse.health = max(0.0, min(CONFIG.MAX_HEALTH, mouse.health))
+        return
 
     # Proximity-based damage: the closer, the more damage
-    if dist < catch_range:
-        proximity_factor = 1.0 - (dist / catch_range)
-        proximity_factor = max(0.0, min(1.0, proximity_factor))
+    dist = math.sqrt(dist_sq)
+    proximity_factor = 1.0 - (dist / catch_range)
+    proximity_factor = max(0.0, min(1.0, proximity_factor))
 
-        transfer_amount = (CONFIG.BASE_DRAIN_RATE * proximity_factor) * dt
+    transfer_amount = (CONFIG.BASE_DRAIN_RATE * proximity_factor) * dt
 
-        mouse.health -= transfer_amount
-        kitten.stamina += transfer_amount
+    mouse.health -= transfer_amount
+    kitten.stamina += transfer_amount
 
     # Passive stamina drain (kitten gets tired over time)
     kitten.stamina -= CONFIG.PASSIVE_STAMINA_DRAIN * dt
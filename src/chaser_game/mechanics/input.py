@@ -1,5 +1,6 @@
 """Input handling system for entity control."""
 
+from collections.abc import Callable
 from typing import Any, Protocol
 
 from pyglet.window import key, mouse
@@ -39,6 +40,16 @@ def handle_keyboard_input(entity: ControllableEntity, keys: Any) -> None:
         pass
 
 
+# Discrete key press bindings: diagonal directions and stop
+_KEY_PRESS_ACTIONS: dict[int, Callable[[ControllableEntity], None]] = {
+    key.HOME: lambda e: e.update_from_keyboard(up=True, down=False, left=True, right=False),
+    key.PAGEUP: lambda e: e.update_from_keyboard(up=True, down=False, left=False, right=True),
+    key.END: lambda e: e.update_from_keyboard(up=False, down=True, left=True, right=False),
+    key.PAGEDOWN: lambda e: e.update_from_keyboard(up=False, down=True, left=False, right=True),
+    key.SPACE: lambda e: e.stop(),
+}
+
+
 def handle_key_press(entity: ControllableEntity, symbol: int) -> None:
     """Handle discrete key press events.
 
@@ -48,17 +59,9 @@ def handle_key_press(entity: ControllableEntity, symbol: int) -> None:
         entity: Mouse entity to control.
         symbol: Key symbol from pyglet.window.key.
     """
-    # Diagonal directional keys
-    if symbol == key.HOME:  # Up-Left
-        entity.update_from_keyboard(up=True, down=False, left=True, right=False)
-    elif symbol == key.PAGEUP:  # Up-Right
-        entity.update_from_keyboard(up=True, down=False, left=False, right=True)
-    elif symbol == key.END:  # Down-Left
-        entity.update_from_keyboard(up=False, down=True, left=True, right=False)
-    elif symbol == key.PAGEDOWN:  # Down-Right
-        entity.update_from_keyboard(up=False, down=True, left=False, right=True)
-    elif symbol == key.SPACE:  # Stop
-        entity.stop()
+    action = _KEY_PRESS_ACTIONS.get(symbol)
+    if action is not None:
+        action(entity)
 
 
 def handle_mouse_press(entity: ControllableEntity, x: float, y: float, button: int) -> None:
@@ -9,8 +9,10 @@ These functions are independent of game state and pygame/pyglet specifics,
 making them ideal for unit testing.
 """
 
-import math
-from typing import NamedTuple
+from math import hypot, sqrt
+from typing import Literal, NamedTuple
+
+DistanceMetric = Literal["euclidean", "manhattan"]
 
 
 class Vector2(NamedTuple):
@@ -20,6 +22,13 @@ class Vector2(NamedTuple):
     y: float
 
 
+# Shared zero vector; Vector2 is immutable, so the no-movement paths need not allocate
+_ZERO = Vector2(0.0, 0.0)
+
+# 1/sqrt(2) to full double precision, the default diagonal normalization
+_DIAGONAL = sqrt(0.5)
+
+
 def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate Euclidean distance between two points.
 
@@ -34,7 +43,7 @@ def distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """
     dx = x2 - x1
     dy = y2 - y1
-    return math.sqrt(dx * dx + dy * dy)
+    return hypot(dx, dy)
 
 
 def normalize_vector(dx: float, dy: float) -> Vector2:
@@ -49,9 +58,9 @@ def normalize_vector(dx: float, dy: float) -> Vector2:
     Returns:
         Normalized vector as Vector2(x, y).
     """
-    length = math.sqrt(dx * dx + dy * dy)
+    length = hypot(dx, dy)
     if length == 0:
-        return Vector2(0.0, 0.0)
+        return _ZERO
     return Vector2(dx / length, dy / length)
 
 
@@ -78,7 +87,7 @@ def calculate_keyboard_velocity(
     left: bool,
     right: bool,
     speed: float,
-    diagonal_factor: float = 0.7071,
+    diagonal_factor: float = _DIAGONAL,
 ) -> Vector2:
     """Calculate velocity from keyboard input.
 
@@ -98,25 +107,33 @@ def calculate_keyboard_velocity(
     Returns:
         Velocity vector as Vector2(vx, vy).
     """
-    vx = 0.0
-    vy = 0.0
+    keys = (8 if up else 0) | (4 if down else 0) | (2 if left else 0) | (1 if right else 0)
+    dx, dy, diagonal = _KEY_DIRECTIONS[keys]
+    scale = speed * diagonal_factor if diagonal else speed
+    return Vector2(dx * scale, dy * scale)
+
+
+def _key_direction(keys: int) -> tuple[float, float, bool]:
+    """Decode packed key bits into a unit direction.
 
-    # Cardinal directions
-    if up:
-        vy += speed
-    if down:
-        vy -= speed
-    if left:
-        vx -= speed
-    if right:
-        vx += speed
+    Args:
+        keys: Pressed keys packed as bits: up=8, down=4, left=2, right=1.
+
+    Returns:
+        Tuple of (dx, dy, diagonal), where diagonal is True when a vertical and a
+        horizontal key are both held and the diagonal factor applies.
+    """
+    up = bool(keys & 8)
+    down = bool(keys & 4)
+    left = bool(keys & 2)
+    right = bool(keys & 1)
+    dx = float(right) - float(left)
+    dy = float(up) - float(down)
+    return dx, dy, (up or down) and (left or right)
 
-    # Apply diagonal normalization if moving diagonally
-    if (up or down) and (left or right):
-        vx *= diagonal_factor
-        vy *= diagonal_factor
 
-    return Vector2(vx, vy)
+# Directions for all 16 key combinations, indexed by the packed key bits
+_KEY_DIRECTIONS = tuple(_key_direction(keys) for keys in range(16))
 
 
 def calculate_click_velocity(
@@ -140,9 +157,12 @@ def calculate_click_velocity(
     """
     dx = target_x - current_x
     dy = target_y - current_y
+    length = hypot(dx, dy)
+    if length == 0:
+        return _ZERO
 
-    direction = normalize_vector(dx, dy)
-    return apply_speed_to_direction(direction.x, direction.y, speed)
+    # Same arithmetic as normalize_vector + apply_speed_to_direction, inlined
+    return Vector2((dx / length) * speed, (dy / length) * speed)
 
 
 def update_position(x: float, y: float, vx: float, vy: float, dt: float) -> Vector2:
@@ -194,12 +214,17 @@ def calculate_chase_velocity(
     target_y: float,
     speed: float,
     distance_threshold: float = 2.0,
+    metric: DistanceMetric = "euclidean",
 ) -> Vector2:
     """Calculate velocity to chase a target.
 
     If the distance to target is less than the threshold, returns zero velocity
     to prevent jitter from very small movements.
 
+    The "manhattan" metric measures the threshold as |dx| + |dy| and scales the
+    direction by that sum instead of the Euclidean length. It avoids the sqrt,
+    but diagonal chases then move slower than ``speed``.
+
     Args:
         current_x: Current x coordinate.
         current_y: Current y coordinate.
@@ -207,17 +232,36 @@ def calculate_chase_velocity(
         target_y: Target y coordinate.
         speed: Chase speed magnitude.
         distance_threshold: Minimum distance before moving (prevents jitter).
+        metric: Distance metric, "euclidean" (default) or "manhattan".
 
     Returns:
         Velocity vector as Vector2(vx, vy).
+
+    Raises:
+        ValueError: If metric is not recognized.
     """
-    dist = distance(current_x, current_y, target_x, target_y)
+    dx = target_x - current_x
+    dy = target_y - current_y
 
-    if dist <= distance_threshold:
-        return Vector2(0.0, 0.0)
+    if metric == "manhattan":
+        dist = abs(dx) + abs(dy)
+        if dist == 0 or dist <= distance_threshold:
+            return _ZERO
+        scale = speed / dist
+        return Vector2(dx * scale, dy * scale)
+    if metric != "euclidean":
+        raise ValueError(f"Unknown distance metric: {metric!r}")
 
-    direction = normalize_vector(target_x - current_x, target_y - current_y)
-    return apply_speed_to_direction(direction.x, direction.y, speed)
+    dist_sq = dx * dx + dy * dy
+
+    # Compare squared distances; the sqrt is only needed once we know we move
+    if dist_sq == 0 or (
+        distance_threshold >= 0 and dist_sq <= distance_threshold * distance_threshold
+    ):
+        return _ZERO
+
+    scale = speed / sqrt(dist_sq)
+    return Vector2(dx * scale, dy * scale)
 
 
 def apply_travel_distance(
@@ -241,16 +285,21 @@ def apply_travel_distance(
     Returns:
         New position as Vector2(x, y).
     """
-    dist = distance(current_x, current_y, target_x, target_y)
+    dx = target_x - current_x
+    dy = target_y - current_y
+    dist_sq = dx * dx + dy * dy
 
-    if dist == 0:
+    if dist_sq == 0 or travel_distance <= 0:
         return Vector2(current_x, current_y)
 
-    direction = normalize_vector(target_x - current_x, target_y - current_y)
-    step = min(travel_distance, dist)
+    # Reaching or overshooting the target snaps to it without a square root
+    if travel_distance * travel_distance >= dist_sq:
+        return Vector2(target_x, target_y)
+
+    dist = hypot(dx, dy)
     return Vector2(
-        current_x + direction.x * step,
-        current_y + direction.y * step,
+        current_x + (dx / dist) * travel_distance,
+        current_y + (dy / dist) * travel_distance,
     )
 
 
@@ -260,6 +309,7 @@ def is_moving(
     target_x: float,
     target_y: float,
     distance_threshold: float = 2.0,
+    metric: DistanceMetric = "euclidean",
 ) -> bool:
     """Check if movement is needed (distance exceeds threshold).
 
@@ -269,11 +319,23 @@ def is_moving(
         target_x: Target x coordinate.
         target_y: Target y coordinate.
         distance_threshold: Minimum distance to be considered "moving".
+        metric: Distance metric, "euclidean" (default) or "manhattan" (|dx| + |dy|).
 
     Returns:
         True if distance > threshold, False otherwise.
+
+    Raises:
+        ValueError: If metric is not recognized.
     """
-    return distance(current_x, current_y, target_x, target_y) > distance_threshold
+    dx = target_x - current_x
+    dy = target_y - current_y
+    if metric == "manhattan":
+        return abs(dx) + abs(dy) > distance_threshold
+    if metric != "euclidean":
+        raise ValueError(f"Unknown distance metric: {metric!r}")
+    if distance_threshold < 0:
+        return True
+    return dx * dx + dy * dy > distance_threshold * distance_threshold
 
 
 def smooth_step(t: float) -> float:
@@ -4,6 +4,12 @@ import pyglet
 
 from ..config import CONFIG
 
+# Threshold and fill colors read on every update, fixed for the lifetime of CONFIG
+_LOW_THRESHOLD = CONFIG.LOW_HEALTH_THRESHOLD
+_COLOR_GOOD = CONFIG.COLOR_HEALTH_GOOD
+_COLOR_LOW = CONFIG.COLOR_HEALTH_LOW
+_COLOR_CRITICAL = CONFIG.COLOR_HEALTH_CRITICAL
+
 
 class HealthBar:
     """Reusable health/stamina bar UI component.
@@ -50,7 +56,7 @@ class HealthBar:
         self.background.opacity = 200
 
         # Foreground (filled) bar
-        self.foreground = pyglet.shapes.Rectangle(x, y, width, height, color=CONFIG.COLOR_HEALTH_GOOD)
+        self.foreground = pyglet.shapes.Rectangle(x, y, width, height, color=_COLOR_GOOD)
 
     def update(self, current_value: float, x: float, y: float) -> None:
         """Update bar position and fill based on current value.
@@ -73,12 +79,12 @@ class HealthBar:
         self.foreground.width = self.width * (clamped_value / self.max_value)
 
         # Update color based on threshold
-        if clamped_value > CONFIG.LOW_HEALTH_THRESHOLD:
-            self.foreground.color = CONFIG.COLOR_HEALTH_GOOD
+        if clamped_value > _LOW_THRESHOLD:
+            self.foreground.color = _COLOR_GOOD
         elif clamped_value > 0:
-            self.foreground.color = CONFIG.COLOR_HEALTH_LOW
+            self.foreground.color = _COLOR_LOW
         else:
-            self.foreground.color = CONFIG.COLOR_HEALTH_CRITICAL
+            self.foreground.color = _COLOR_CRITICAL
 
     def draw(self) -> None:
         """Draw both background and foreground bars."""
@@ -0,0 +1,28 @@
+"""Shared pytest fixtures for the chaser_game test suite."""
+
+from importlib.resources import files
+from types import ModuleType
+
+import pytest
+from chaser_game.asset_manifest import AssetManifest
+from chaser_game.assets import AssetLoader, get_loader
+
+
+@pytest.fixture(scope="session", autouse=True)
+def loader() -> AssetLoader:
+    """Initialize the asset loader singleton and pyglet resource path once per run."""
+    return get_loader()
+
+
+@pytest.fixture(scope="session")
+def hello_world_module() -> ModuleType:
+    """The game entry module, imported once per run."""
+    from chaser_game import hello_world
+
+    return hello_world
+
+
+@pytest.fixture(scope="session")
+def manifest() -> AssetManifest:
+    """The project asset manifest, parsed once per run and shared read-only."""
+    return AssetManifest(str(files("chaser_game") / "assets" / "manifest.yaml"))
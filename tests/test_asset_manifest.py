@@ -111,6 +111,34 @@ class TestAssetManifest(unittest.TestCase):
         self.assertNotIn("assets/images/kitten.png", ignored)
         self.assertNotIn("assets/audio/sfx/meow.wav", ignored)
 
+    def test_get_asset_by_name(self) -> None:
+        """Test flat lookup of asset metadata across sections."""
+        manifest = AssetManifest(self.manifest_path)
+
+        self.assertIs(manifest.get_asset("kitten"), manifest.images["kitten"])
+        self.assertIs(manifest.get_asset("meow"), manifest.audio["meow"])
+        self.assertIs(manifest.get_asset("mouse_video"), manifest.source["mouse_video"])
+        self.assertEqual(manifest.get_asset("missing"), {})
+
+    def test_asset_lists_are_independent_copies(self) -> None:
+        """Test that each call returns a fresh list callers may modify."""
+        manifest = AssetManifest(self.manifest_path)
+
+        paths = manifest.get_asset_paths()
+        self.assertIsInstance(paths, list)
+        paths.clear()
+
+        self.assertEqual(len(manifest.get_asset_paths()), 5)
+
+    def test_sections_are_read_only(self) -> None:
+        """Test that the parsed sections cannot be edited or replaced."""
+        manifest = AssetManifest(self.manifest_path)
+
+        with self.assertRaises(TypeError):
+            manifest.images["extra"] = {"path": "assets/images/extra.png"}  # type: ignore[index]
+        with self.assertRaises(AttributeError):
+            manifest.audio = {}  # type: ignore[misc]
+
     def test_validate_assets_all_present(self) -> None:
         """Test validation when all tracked assets exist."""
         # Create the tracked asset files
@@ -203,6 +231,21 @@ class TestAssetManifestIntegration(unittest.TestCase):
         paths = manifest.get_asset_paths()
         self.assertGreater(len(paths), 0)
 
+    def test_project_manifest_matches_pure_python_loader(self) -> None:
+        """Test that the manifest parses identically with the pure-Python SafeLoader."""
+        manifest_path = os.path.join(
+            os.path.dirname(__file__),
+            "../src/chaser_game/assets/manifest.yaml",
+        )
+
+        if not os.path.exists(manifest_path):
+            self.skipTest("Project manifest not found")
+
+        with open(manifest_path) as f:
+            expected = yaml.load(f, Loader=yaml.SafeLoader)
+
+        self.assertEqual(AssetManifest(manifest_path).data, expected)
+
     def test_project_manifest_has_tracked_assets(self) -> None:
         """Test that project manifest has tracked assets."""
         manifest_path = os.path.join(
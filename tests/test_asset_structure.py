@@ -3,9 +3,16 @@
 import os
 import unittest
 
+import pytest
 from chaser_game.asset_manifest import AssetManifest
 
 
+@pytest.fixture(autouse=True)
+def _attach_manifest(request: pytest.FixtureRequest, manifest: AssetManifest) -> None:
+    """Give each TestCase the session manifest as ``self.manifest``."""
+    request.instance.manifest = manifest
+
+
 class TestAssetDirectoryStructure(unittest.TestCase):
     """Tests for asset directory structure and organization."""
 
@@ -52,7 +59,7 @@ class TestAssetDirectoryStructure(unittest.TestCase):
 
     def test_tracked_assets_exist(self) -> None:
         """Test that all tracked assets exist in their expected locations."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         tracked = manifest.get_tracked_assets()
 
         missing = []
@@ -113,7 +120,7 @@ class TestAssetDirectoryStructure(unittest.TestCase):
 
     def test_manifest_asset_paths_structure(self) -> None:
         """Test that manifest asset paths follow expected directory structure."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
 
         # Check that image assets are in images/ or sprites/
         for asset in manifest.images.values():
@@ -144,7 +151,7 @@ class TestAssetDirectoryStructure(unittest.TestCase):
 
     def test_asset_file_permissions_readable(self) -> None:
         """Test that tracked asset files are readable."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         tracked = manifest.get_tracked_assets()
 
         for asset_path in tracked:
@@ -157,7 +164,7 @@ class TestAssetDirectoryStructure(unittest.TestCase):
 
     def test_no_duplicate_asset_paths(self) -> None:
         """Test that no asset paths are duplicated in manifest."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         paths = manifest.get_asset_paths()
 
         duplicates = [p for p in paths if paths.count(p) > 1]
@@ -195,7 +202,7 @@ class TestAssetDirectoryStructure(unittest.TestCase):
 
     def test_manifest_lists_all_tracked_assets(self) -> None:
         """Test that all tracked asset files are listed in manifest."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         manifest_paths = set(manifest.get_asset_paths())
 
         # Scan actual directories for tracked assets
@@ -243,7 +250,7 @@ class TestAssetPathConsistency(unittest.TestCase):
 
     def test_asset_paths_use_forward_slashes(self) -> None:
         """Test that all asset paths in manifest use forward slashes."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         paths = manifest.get_asset_paths()
 
         for path in paths:
@@ -260,7 +267,7 @@ class TestAssetPathConsistency(unittest.TestCase):
 
     def test_asset_paths_follow_structure(self) -> None:
         """Test that all asset paths follow expected structure."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         paths = manifest.get_asset_paths()
 
         for path in paths:
@@ -273,7 +280,7 @@ class TestAssetPathConsistency(unittest.TestCase):
 
     def test_asset_extensions_valid(self) -> None:
         """Test that assets have valid file extensions."""
-        manifest = AssetManifest(self.manifest_path)
+        manifest = self.manifest
         paths = manifest.get_asset_paths()
 
         valid_extensions = {
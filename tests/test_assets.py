@@ -36,6 +36,13 @@ class TestAssetLoader(unittest.TestCase):
         # pyglet.resource.path should include the assets directory
         self.assertIn(loader.script_dir, pyglet.resource.path)
 
+    def test_resource_path_snapshot(self) -> None:
+        """Test that the loader exposes a deduplicated, immutable resource path."""
+        loader = AssetLoader()
+
+        self.assertEqual(loader.resource_path, (loader.script_dir, loader.assets_dir))
+        self.assertEqual(list(loader.resource_path), pyglet.resource.path)
+
     @patch("pyglet.resource.image")
     def test_load_image_success(self, mock_image: MagicMock) -> None:
         """Test successful image loading."""
@@ -1,75 +1,85 @@
 """Tests for the configuration module."""
 
-import unittest
-
 from chaser_game.config import CONFIG, GameConfig
 
 
-class TestGameConfig(unittest.TestCase):
-    """Test the GameConfig dataclass."""
-
-    def test_config_creation(self) -> None:
-        """Test creating a GameConfig instance with defaults."""
-        config = GameConfig()
-        self.assertEqual(config.WINDOW_WIDTH, 800)
-        self.assertEqual(config.WINDOW_HEIGHT, 600)
-        self.assertEqual(config.TARGET_FPS, 60.0)
-
-    def test_config_movement_constants(self) -> None:
-        """Test movement-related constants."""
-        config = GameConfig()
-        self.assertEqual(config.WINDOW_TRAVERSAL_TIME, 10.0)
-        self.assertEqual(config.KITTEN_SPEED_FACTOR, 1.5)
-        self.assertAlmostEqual(config.DIAGONAL_MOVEMENT_FACTOR, 0.7071, places=4)
-        self.assertEqual(config.MOVEMENT_DISTANCE_THRESHOLD, 2.0)
-
-    def test_config_frame_drop_threshold(self) -> None:
-        """Test frame drop warning threshold constant."""
-        config = GameConfig()
-        self.assertEqual(config.FRAME_DROP_THRESHOLD, 0.03)
-
-    def test_config_health_constants(self) -> None:
-        """Test health and stamina constants."""
-        config = GameConfig()
-        self.assertEqual(config.MAX_HEALTH, 100.0)
-        self.assertEqual(config.MAX_STAMINA, 100.0)
-        self.assertEqual(config.BASE_DRAIN_RATE, 20.0)
-        self.assertEqual(config.PASSIVE_STAMINA_DRAIN, 2.0)
-        self.assertEqual(config.LOW_HEALTH_THRESHOLD, 30.0)
-
-    def test_config_ui_constants(self) -> None:
-        """Test UI bar configuration."""
-        config = GameConfig()
-        self.assertEqual(config.BAR_WIDTH, 50)
-        self.assertEqual(config.BAR_HEIGHT, 5)
-        self.assertEqual(config.BAR_OFFSET, 20)
-
-    def test_config_colors(self) -> None:
-        """Test color constants are RGB tuples."""
-        config = GameConfig()
-        self.assertEqual(config.COLOR_DARK_GRAY, (50, 50, 50))
-        self.assertEqual(config.COLOR_GREEN, (46, 204, 113))
-        self.assertEqual(config.COLOR_RED, (231, 76, 60))
-
-    def test_config_asset_paths(self) -> None:
-        """Test asset path constants."""
-        config = GameConfig()
-        self.assertEqual(config.ASSET_KITTEN_IMAGE, "assets/images/kitten.png")
-        self.assertEqual(config.ASSET_MOUSE_SHEET, "assets/sprites/mouse_sheet.png")
-        self.assertEqual(config.ASSET_MEOW_SOUND, "assets/audio/sfx/meow.wav")
-        self.assertEqual(config.ASSET_AMBIENCE_MUSIC, "assets/audio/music/ambience.wav")
-
-    def test_config_ui_text(self) -> None:
-        """Test UI text constants."""
-        config = GameConfig()
-        self.assertEqual(config.TEXT_HELLO_WORLD, "Hello, world!")
-
-    def test_global_config_instance(self) -> None:
-        """Test that global CONFIG instance exists and is valid."""
-        self.assertIsInstance(CONFIG, GameConfig)
-        self.assertEqual(CONFIG.WINDOW_WIDTH, 800)
-        self.assertEqual(CONFIG.MAX_HEALTH, 100.0)
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_config_creation() -> None:
+    """Test creating a GameConfig instance with defaults."""
+    config = GameConfig()
+    assert config.WINDOW_WIDTH == 800
+    assert config.WINDOW_HEIGHT == 600
+    assert config.TARGET_FPS == 60.0
+
+
+def test_config_movement_constants() -> None:
+    """Test movement-related constants."""
+    config = GameConfig()
+    assert (
+        config.WINDOW_TRAVERSAL_TIME,
+        config.KITTEN_SPEED_FACTOR,
+        config.DIAGONAL_MOVEMENT_FACTOR,
+        config.MOVEMENT_DISTANCE_THRESHOLD,
+    ) == (10.0, 1.5, 0.7071, 2.0)
+
+
+def test_config_frame_drop_threshold() -> None:
+    """Test frame drop warning threshold constant."""
+    config = GameConfig()
+    assert config.FRAME_DROP_THRESHOLD == 0.03
+
+
+def test_config_health_constants() -> None:
+    """Test health and stamina constants."""
+    config = GameConfig()
+    assert (
+        config.MAX_HEALTH,
+        config.MAX_STAMINA,
+        config.BASE_DRAIN_RATE,
+        config.PASSIVE_STAMINA_DRAIN,
+        config.LOW_HEALTH_THRESHOLD,
+    ) == (100.0, 100.0, 20.0, 2.0, 30.0)
+
+
+def test_config_ui_constants() -> None:
+    """Test UI bar configuration."""
+    config = GameConfig()
+    assert config.BAR_WIDTH == 50
+    assert config.BAR_HEIGHT == 5
+    assert config.BAR_OFFSET == 20
+
+
+def test_config_colors() -> None:
+    """Test color constants are RGB tuples."""
+    config = GameConfig()
+    assert config.COLOR_DARK_GRAY == (50, 50, 50)
+    assert config.COLOR_GREEN == (46, 204, 113)
+    assert config.COLOR_RED == (231, 76, 60)
+
+
+def test_config_asset_paths() -> None:
+    """Test asset path constants."""
+    config = GameConfig()
+    assert config.ASSET_KITTEN_IMAGE == "assets/images/kitten.png"
+    assert config.ASSET_MOUSE_SHEET == "assets/sprites/mouse_sheet.png"
+    assert config.ASSET_MEOW_SOUND == "assets/audio/sfx/meow.wav"
+    assert config.ASSET_AMBIENCE_MUSIC == "assets/audio/music/ambience.wav"
+
+
+def test_config_ui_text() -> None:
+    """Test UI text constants."""
+    config = GameConfig()
+    assert config.TEXT_HELLO_WORLD == "Hello, world!"
+
+
+def test_scalars_are_class_level() -> None:
+    """Test that scalar constants are not copied into instances."""
+    config = GameConfig()
+    assert "WINDOW_WIDTH" not in vars(config)
+    assert config.MAX_HEALTH is GameConfig.MAX_HEALTH
+
+
+def test_global_config_instance() -> None:
+    """Test that global CONFIG instance exists and is valid."""
+    assert isinstance(CONFIG, GameConfig)
+    assert CONFIG.WINDOW_WIDTH == 800
+    assert CONFIG.MAX_HEALTH == 100.0
@@ -0,0 +1,296 @@
+"""Tests for the entities.character module."""
+
+import math
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from chaser_game.config import CONFIG
+from chaser_game.entities import Character, CharacterState, Kitten, Mouse
+from pyglet.window import key, mouse
+
+MAX_HEALTH = CONFIG.MAX_HEALTH
+MAX_STAMINA = CONFIG.MAX_STAMINA
+FRAME_TIME = 1.0 / CONFIG.TARGET_FPS
+MOUSE_SPEED = CONFIG.WINDOW_WIDTH / CONFIG.WINDOW_TRAVERSAL_TIME
+DIAGONAL_SPEED = MOUSE_SPEED * CONFIG.DIAGONAL_MOVEMENT_FACTOR
+KITTEN_SPEED = MOUSE_SPEED / CONFIG.KITTEN_SPEED_FACTOR
+# Where the game places the kitten in an 800x600 window; passed to reset() as the start point
+START_X = 800.0 * CONFIG.KITTEN_START_X_RATIO
+START_Y = 600.0 * CONFIG.KITTEN_START_Y_RATIO
+# Window size passed to update() and clamp_to_bounds()
+_BOUNDS = (800.0, 600.0)
+
+
+@pytest.fixture
+def character() -> Character:
+    """A 20x10 character in the middle of an 800x600 window."""
+    return Character(400.0, 300.0, 20.0, 10.0)
+
+
+def test_character_initial_state(character: Character) -> None:
+    """A new character is idle with full health and stamina."""
+    assert character.state == CharacterState.IDLE
+    assert character.health == MAX_HEALTH
+    assert character.stamina == MAX_STAMINA
+
+
+def test_character_uses_slots(character: Character) -> None:
+    """Characters do not carry a per-instance __dict__."""
+    assert not hasattr(character, "__dict__")
+    with pytest.raises(AttributeError):
+        character.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_character_update_applies_velocity(character: Character) -> None:
+    """Update moves the character by velocity * dt."""
+    character.velocity_x = MOUSE_SPEED
+    character.velocity_y = -DIAGONAL_SPEED
+    dx, dy = MOUSE_SPEED * FRAME_TIME, -DIAGONAL_SPEED * FRAME_TIME
+
+    character.update(FRAME_TIME, 800.0, 600.0)
+
+    assert (character.center_x, character.center_y) == pytest.approx((400.0 + dx, 300.0 + dy))
+    assert character.state == CharacterState.MOVING
+    assert character.get_distance_traveled() == pytest.approx(math.hypot(dx, dy))
+
+
+def test_character_update_clamps_to_bounds(character: Character) -> None:
+    """Update keeps the character inside the window."""
+    character.velocity_x = 10_000.0
+    character.velocity_y = -10_000.0
+
+    character.update(1.0, 800.0, 600.0)
+
+    assert (character.center_x, character.center_y) == (790.0, 5.0)
+
+
+def test_character_update_without_velocity_is_idle(character: Character) -> None:
+    """A stationary character stays idle."""
+    character.update(1.0, 800.0, 600.0)
+
+    assert character.state == CharacterState.IDLE
+    assert character.get_distance_traveled() == 0.0
+
+
+@pytest.mark.parametrize(
+    ("position", "expected"),
+    [
+        pytest.param((400.0, 300.0), (400.0, 300.0), id="inside"),
+        pytest.param((-100.0, 300.0), (10.0, 300.0), id="left"),
+        pytest.param((900.0, 300.0), (790.0, 300.0), id="right"),
+        pytest.param((400.0, -100.0), (400.0, 5.0), id="bottom"),
+        pytest.param((400.0, 1000.0), (400.0, 595.0), id="top"),
+        pytest.param((-100.0, 1000.0), (10.0, 595.0), id="corner"),
+    ],
+)
+def test_character_clamp_to_bounds(
+    character: Character, position: tuple[float, float], expected: tuple[float, float]
+) -> None:
+    """Clamping keeps the whole 20x10 character inside the window."""
+    character.center_x, character.center_y = position
+
+    character.clamp_to_bounds(800.0, 600.0)
+
+    assert (character.center_x, character.center_y) == expected
+
+
+def test_character_resize_updates_clamp(character: Character) -> None:
+    """Changing the size after construction moves the clamp limits with it."""
+    character.width, character.height = 40.0, 30.0
+    character.center_x, character.center_y = -100.0, 1000.0
+
+    character.clamp_to_bounds(800.0, 600.0)
+
+    assert (character.width, character.height) == (40.0, 30.0)
+    assert (character.center_x, character.center_y) == (20.0, 585.0)
+
+
+def test_character_distance_to(character: Character) -> None:
+    """Distance to a point."""
+    assert character.distance_to(403.0, 304.0) == 5.0
+
+
+@pytest.fixture
+def make_mouse() -> Callable[..., Mouse]:
+    """Factory for new mice with their own 25x25 mocked sprite, centered in an 800x600 window.
+
+    Keyword arguments override attributes on the new mouse, e.g. ``make_mouse(center_x=10.0)``.
+    """
+
+    def _make(**overrides: Any) -> Mouse:
+        mouse = Mouse(400.0, 300.0, MagicMock(width=25, height=25, x=0, y=0))
+        for name, value in overrides.items():
+            setattr(mouse, name, value)
+        return mouse
+
+    return _make
+
+
+@pytest.fixture
+def make_kitten() -> Callable[..., Kitten]:
+    """Factory for new 50x50 kittens with their own mocked image at (100, 100).
+
+    Keyword arguments override attributes on the new kitten, e.g. ``make_kitten(center_x=10.0)``.
+    """
+
+    def _make(**overrides: Any) -> Kitten:
+        kitten = Kitten(100.0, 100.0, 50.0, 50.0, MagicMock(width=50, height=50))
+        for name, value in overrides.items():
+            setattr(kitten, name, value)
+        return kitten
+
+    return _make
+
+
+@pytest.fixture
+def sized_mouse(make_mouse: Callable[..., Mouse]) -> Mouse:
+    """A mouse with a 25x25 mocked sprite in the middle of an 800x600 window."""
+    return make_mouse()
+
+
+@pytest.mark.parametrize(
+    ("symbol", "expected"),
+    [
+        pytest.param(key.UP, (0.0, MOUSE_SPEED), id="up"),
+        pytest.param(key.DOWN, (0.0, -MOUSE_SPEED), id="down"),
+        pytest.param(key.LEFT, (-MOUSE_SPEED, 0.0), id="left"),
+        pytest.param(key.RIGHT, (MOUSE_SPEED, 0.0), id="right"),
+        pytest.param(key.HOME, (-DIAGONAL_SPEED, DIAGONAL_SPEED), id="up_left"),
+        pytest.param(key.PAGEUP, (DIAGONAL_SPEED, DIAGONAL_SPEED), id="up_right"),
+        pytest.param(key.END, (-DIAGONAL_SPEED, -DIAGONAL_SPEED), id="down_left"),
+        pytest.param(key.PAGEDOWN, (DIAGONAL_SPEED, -DIAGONAL_SPEED), id="down_right"),
+        pytest.param(key.SPACE, (0.0, 0.0), id="stop"),
+    ],
+)
+def test_mouse_key_sets_velocity(
+    sized_mouse: Mouse, symbol: int, expected: tuple[float, float]
+) -> None:
+    """Each movement key sets the matching velocity and is consumed."""
+    sized_mouse.velocity_x = 10.0
+    assert sized_mouse.on_key_press(symbol, 0)
+    assert (sized_mouse.velocity_x, sized_mouse.velocity_y) == expected
+
+
+def test_mouse_unhandled_key(sized_mouse: Mouse) -> None:
+    """Unrelated keys are not consumed."""
+    assert not sized_mouse.on_key_press(key.A, 0)
+
+
+@pytest.mark.parametrize(
+    ("button", "handled", "expected"),
+    [
+        pytest.param(mouse.LEFT, True, (MOUSE_SPEED, 0.0), id="left"),
+        pytest.param(mouse.RIGHT, False, (0.0, 0.0), id="right"),
+    ],
+)
+def test_mouse_click(
+    sized_mouse: Mouse, button: int, handled: bool, expected: tuple[float, float]
+) -> None:
+    """A left click heads toward the clicked point; other buttons are ignored."""
+    assert sized_mouse.on_mouse_press(500, 300, button, 0) is handled
+    assert (sized_mouse.velocity_x, sized_mouse.velocity_y) == expected
+
+
+def test_mouse_update_tracks_total_distance(sized_mouse: Mouse) -> None:
+    """Update accumulates distance traveled."""
+    sized_mouse.velocity_x = 30.0
+    sized_mouse.velocity_y = 40.0
+    sized_mouse.update(1.0, 800.0, 600.0)
+    assert sized_mouse.total_distance == 50.0
+
+
+def test_mouse_reset(sized_mouse: Mouse) -> None:
+    """Reset restores position, velocity and counters."""
+    sized_mouse.velocity_x = 30.0
+    sized_mouse.health = 10.0
+    sized_mouse.total_distance = 99.0
+
+    sized_mouse.reset(100.0, 200.0)
+
+    assert (sized_mouse.center_x, sized_mouse.center_y) == (100.0, 200.0)
+    assert sized_mouse.velocity_x == 0.0
+    assert sized_mouse.health == MAX_HEALTH
+    assert sized_mouse.total_distance == 0.0
+    assert sized_mouse.state == CharacterState.IDLE
+
+
+def test_kitten_speed_calculation(make_kitten: Callable[..., Kitten]) -> None:
+    """Speed derives from the traversal time and speed factor."""
+    assert make_kitten().speed == KITTEN_SPEED
+
+
+def test_kitten_chase_moves_toward_target(make_kitten: Callable[..., Kitten]) -> None:
+    """Chasing a distant target moves one frame's worth."""
+    kitten = make_kitten()
+    assert kitten.chase_target(500.0, 100.0)
+
+    step = kitten.speed * FRAME_TIME
+    assert kitten.center_x == 100.0 + step
+    assert kitten.center_y == 100.0
+    assert kitten.state == CharacterState.CHASING
+
+
+def test_kitten_chase_stops_within_threshold(make_kitten: Callable[..., Kitten]) -> None:
+    """The kitten idles once it reaches the target."""
+    kitten = make_kitten(center_x=300.0, was_moving=True, state=CharacterState.CHASING)
+    assert not kitten.chase_target(301.0, 100.0)
+    assert kitten.state == CharacterState.IDLE
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "attr", "value"),
+    [
+        pytest.param("clamp_to_bounds", _BOUNDS, "center_x", 25.0, id="clamp_to_bounds-x"),
+        pytest.param("clamp_to_bounds", _BOUNDS, "center_y", 25.0, id="clamp_to_bounds-y"),
+        pytest.param("update", (1.0, *_BOUNDS), "center_x", 25.0, id="update-x"),
+        pytest.param("update", (1.0, *_BOUNDS), "center_y", 25.0, id="update-y"),
+        pytest.param("update", (1.0, *_BOUNDS), "state", CharacterState.IDLE, id="update-state"),
+        pytest.param("reset_health_stamina", (), "health", MAX_HEALTH, id="reset-health"),
+        pytest.param("reset_health_stamina", (), "stamina", MAX_STAMINA, id="reset-stamina"),
+    ],
+)
+def test_kitten_inherited_behavior(
+    make_kitten: Callable[..., Kitten],
+    method: str,
+    args: tuple[float, ...],
+    attr: str,
+    value: object,
+) -> None:
+    """Kitten keeps the Character behaviour it does not override."""
+    kitten = make_kitten(center_x=-10.0, center_y=-10.0, health=1.0, stamina=1.0)
+
+    getattr(kitten, method)(*args)
+
+    assert getattr(kitten, attr) == value
+
+
+@pytest.mark.parametrize("stamina", [5.0, 0.0], ids=["tired", "exhausted"])
+def test_kitten_reset(make_kitten: Callable[..., Kitten], stamina: float) -> None:
+    """Reset moves the kitten to the given start point and clears its chase state."""
+    kitten = make_kitten(stamina=stamina)
+    kitten.chase_target(500.0, 100.0)
+
+    kitten.reset(START_X, START_Y)
+
+    assert (kitten.center_x, kitten.center_y) == (START_X, START_Y)
+    assert kitten.stamina == MAX_STAMINA
+    assert not kitten.was_moving
+    assert kitten.state == CharacterState.IDLE
+
+
+def test_reset_multiple_times(
+    make_mouse: Callable[..., Mouse], make_kitten: Callable[..., Kitten]
+) -> None:
+    """Repeated reset cycles always land back on the given start point and state."""
+    for character in (make_mouse(), make_kitten()):
+        for i in range(2):
+            character.center_x = 100.0 * (i + 1)
+            character.stamina = 50.0 / (i + 1)
+
+            character.reset(START_X, START_Y)
+
+            assert (character.center_x, character.center_y) == (START_X, START_Y)
+            assert character.stamina == MAX_STAMINA
+            assert character.state == CharacterState.IDLE
@@ -1,178 +1,129 @@
 """Tests for the game state machine."""
 
-import unittest
-
+import pytest
 from chaser_game.game_state import GameState, GameStateManager
 
 
-class TestGameState(unittest.TestCase):
-    """Test the GameState enum."""
-
-    def test_game_state_values(self) -> None:
-        """Test that GameState has all required values."""
-        self.assertEqual(GameState.PLAYING.name, "PLAYING")
-        self.assertEqual(GameState.PAUSED.name, "PAUSED")
-        self.assertEqual(GameState.GAME_OVER_WIN.name, "GAME_OVER_WIN")
-        self.assertEqual(GameState.GAME_OVER_LOSE.name, "GAME_OVER_LOSE")
-
-    def test_game_state_uniqueness(self) -> None:
-        """Test that GameState values are unique."""
-        states = [
-            GameState.PLAYING,
-            GameState.PAUSED,
-            GameState.GAME_OVER_WIN,
-            GameState.GAME_OVER_LOSE,
-        ]
-        self.assertEqual(len(states), len(set(states)))
-
-
-class TestGameStateManager(unittest.TestCase):
-    """Test the GameStateManager class."""
-
-    def test_state_manager_initial_state(self) -> None:
-        """Test that GameStateManager starts in PLAYING state."""
-        manager = GameStateManager()
-        self.assertEqual(manager.state, GameState.PLAYING)
-
-    def test_set_state(self) -> None:
-        """Test setting a new state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_WIN)
-        self.assertEqual(manager.state, GameState.GAME_OVER_WIN)
-
-    def test_is_playing_true(self) -> None:
-        """Test is_playing returns True when in PLAYING state."""
-        manager = GameStateManager()
-        self.assertTrue(manager.is_playing())
-
-    def test_is_playing_false(self) -> None:
-        """Test is_playing returns False when not in PLAYING state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_WIN)
-        self.assertFalse(manager.is_playing())
-
-    def test_is_game_over_false_when_playing(self) -> None:
-        """Test is_game_over returns False when playing."""
-        manager = GameStateManager()
-        self.assertFalse(manager.is_game_over())
-
-    def test_is_game_over_true_on_win(self) -> None:
-        """Test is_game_over returns True on win."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_WIN)
-        self.assertTrue(manager.is_game_over())
-
-    def test_is_game_over_true_on_lose(self) -> None:
-        """Test is_game_over returns True on lose."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_LOSE)
-        self.assertTrue(manager.is_game_over())
-
-    def test_is_game_over_false_when_paused(self) -> None:
-        """Test is_game_over returns False when paused."""
-        manager = GameStateManager()
-        manager.set_state(GameState.PAUSED)
-        self.assertFalse(manager.is_game_over())
-
-    def test_is_player_won_true(self) -> None:
-        """Test is_player_won returns True on win state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_WIN)
-        self.assertTrue(manager.is_player_won())
-
-    def test_is_player_won_false_on_lose(self) -> None:
-        """Test is_player_won returns False on lose state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_LOSE)
-        self.assertFalse(manager.is_player_won())
-
-    def test_is_player_won_false_when_playing(self) -> None:
-        """Test is_player_won returns False when playing."""
-        manager = GameStateManager()
-        self.assertFalse(manager.is_player_won())
-
-    def test_is_player_lost_true(self) -> None:
-        """Test is_player_lost returns True on lose state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_LOSE)
-        self.assertTrue(manager.is_player_lost())
-
-    def test_is_player_lost_false_on_win(self) -> None:
-        """Test is_player_lost returns False on win state."""
-        manager = GameStateManager()
-        manager.set_state(GameState.GAME_OVER_WIN)
-        self.assertFalse(manager.is_player_lost())
-
-    def test_is_player_lost_false_when_playing(self) -> None:
-        """Test is_player_lost returns False when playing."""
-        manager = GameStateManager()
-        self.assertFalse(manager.is_player_lost())
-
-    def test_win_transition(self) -> None:
-        """Test win() method transitions to GAME_OVER_WIN."""
-        manager = GameStateManager()
-        manager.win()
-        self.assertEqual(manager.state, GameState.GAME_OVER_WIN)
-        self.assertTrue(manager.is_player_won())
-
-    def test_lose_transition(self) -> None:
-        """Test lose() method transitions to GAME_OVER_LOSE."""
-        manager = GameStateManager()
-        manager.lose()
-        self.assertEqual(manager.state, GameState.GAME_OVER_LOSE)
-        self.assertTrue(manager.is_player_lost())
-
-    def test_reset(self) -> None:
-        """Test reset() method returns to PLAYING state."""
-        manager = GameStateManager()
-        manager.win()
-        self.assertTrue(manager.is_game_over())
-
-        manager.reset()
-        self.assertEqual(manager.state, GameState.PLAYING)
-        self.assertTrue(manager.is_playing())
-
-    def test_state_transitions_sequence(self) -> None:
-        """Test a sequence of state transitions."""
-        manager = GameStateManager()
-
-        # Start playing
-        self.assertTrue(manager.is_playing())
-        self.assertFalse(manager.is_game_over())
-
-        # Win
-        manager.win()
-        self.assertFalse(manager.is_playing())
-        self.assertTrue(manager.is_game_over())
-        self.assertTrue(manager.is_player_won())
-
-        # Reset to playing
-        manager.reset()
-        self.assertTrue(manager.is_playing())
-        self.assertFalse(manager.is_game_over())
-
-        # Lose
-        manager.lose()
-        self.assertFalse(manager.is_playing())
-        self.assertTrue(manager.is_game_over())
-        self.assertTrue(manager.is_player_lost())
-
-    def test_multiple_state_changes(self) -> None:
-        """Test multiple rapid state changes."""
-        manager = GameStateManager()
-
-        manager.set_state(GameState.PAUSED)
-        self.assertEqual(manager.state, GameState.PAUSED)
-
-        manager.set_state(GameState.PLAYING)
-        self.assertEqual(manager.state, GameState.PLAYING)
-
-        manager.win()
-        self.assertEqual(manager.state, GameState.GAME_OVER_WIN)
-
-        manager.reset()
-        self.assertEqual(manager.state, GameState.PLAYING)
-
-
-if __name__ == "__main__":
-    unittest.main()
+def test_game_state_values() -> None:
+    """GameState has all required values."""
+    assert GameState.PLAYING.name == "PLAYING"
+    assert GameState.PAUSED.name == "PAUSED"
+    assert GameState.GAME_OVER_WIN.name == "GAME_OVER_WIN"
+    assert GameState.GAME_OVER_LOSE.name == "GAME_OVER_LOSE"
+
+
+def test_game_state_uniqueness() -> None:
+    """GameState values are unique."""
+    states = [
+        GameState.PLAYING,
+        GameState.PAUSED,
+        GameState.GAME_OVER_WIN,
+        GameState.GAME_OVER_LOSE,
+    ]
+    assert len(states) == len(set(states))
+
+
+@pytest.fixture
+def manager() -> GameStateManager:
+    """A fresh GameStateManager."""
+    return GameStateManager()
+
+
+# Expected (is_playing, is_game_over, is_player_won, is_player_lost) per state
+PREDICATE_TABLE = {
+    GameState.PLAYING: (True, False, False, False),
+    GameState.PAUSED: (False, False, False, False),
+    GameState.GAME_OVER_WIN: (False, True, True, False),
+    GameState.GAME_OVER_LOSE: (False, True, False, True),
+}
+PREDICATES = ("is_playing", "is_game_over", "is_player_won", "is_player_lost")
+
+
+@pytest.mark.parametrize(
+    ("state", "predicate", "expected"),
+    [
+        (state, predicate, expected)
+        for state, row in PREDICATE_TABLE.items()
+        for predicate, expected in zip(PREDICATES, row, strict=True)
+    ],
+)
+def test_predicate(
+    manager: GameStateManager, state: GameState, predicate: str, expected: bool
+) -> None:
+    """Each state predicate matches the state table."""
+    manager.set_state(state)
+    assert getattr(manager, predicate)() is expected
+
+
+def test_state_manager_initial_state(manager: GameStateManager) -> None:
+    """GameStateManager starts in PLAYING state."""
+    assert manager.state == GameState.PLAYING
+
+
+def test_set_state(manager: GameStateManager) -> None:
+    """Setting a new state."""
+    manager.set_state(GameState.GAME_OVER_WIN)
+    assert manager.state == GameState.GAME_OVER_WIN
+
+
+def test_win_transition(manager: GameStateManager) -> None:
+    """win() transitions to GAME_OVER_WIN."""
+    manager.win()
+    assert manager.state == GameState.GAME_OVER_WIN
+    assert manager.is_player_won()
+
+
+def test_lose_transition(manager: GameStateManager) -> None:
+    """lose() transitions to GAME_OVER_LOSE."""
+    manager.lose()
+    assert manager.state == GameState.GAME_OVER_LOSE
+    assert manager.is_player_lost()
+
+
+@pytest.mark.parametrize("initial", list(GameState))
+def test_reset(manager: GameStateManager, initial: GameState) -> None:
+    """reset() returns to PLAYING from any state."""
+    manager.set_state(initial)
+
+    manager.reset()
+    assert manager.state == GameState.PLAYING
+    assert manager.is_playing()
+
+
+def test_state_transitions_sequence(manager: GameStateManager) -> None:
+    """A sequence of state transitions."""
+    # Start playing
+    assert manager.is_playing()
+    assert not manager.is_game_over()
+
+    # Win
+    manager.win()
+    assert not manager.is_playing()
+    assert manager.is_game_over()
+    assert manager.is_player_won()
+
+    # Reset to playing
+    manager.reset()
+    assert manager.is_playing()
+    assert not manager.is_game_over()
+
+    # Lose
+    manager.lose()
+    assert not manager.is_playing()
+    assert manager.is_game_over()
+    assert manager.is_player_lost()
+
+
+def test_multiple_state_changes(manager: GameStateManager) -> None:
+    """Multiple rapid state changes."""
+    manager.set_state(GameState.PAUSED)
+    assert manager.state == GameState.PAUSED
+
+    manager.set_state(GameState.PLAYING)
+    assert manager.state == GameState.PLAYING
+
+    manager.win()
+    assert manager.state == GameState.GAME_OVER_WIN
+
+    manager.reset()
+    assert manager.state == GameState.PLAYING
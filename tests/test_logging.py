@@ -10,15 +10,36 @@ Verifies:
 
 import logging
 import sys
-from io import StringIO
+from collections.abc import Iterator
 from pathlib import Path
-from tempfile import TemporaryDirectory
+
+import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from chaser_game.logging_config import LogConfig, close_logging, get_logger, init_logging
 
 
+@pytest.fixture(autouse=True)
+def _restore_root_logger() -> Iterator[None]:
+    """Drop root handlers added by a test and restore the root level afterwards."""
+    root = logging.getLogger()
+    saved_handlers = set(root.handlers)
+    saved_level = root.level
+    yield
+    close_logging()
+    root.handlers[:] = [h for h in root.handlers if h in saved_handlers]
+    root.setLevel(saved_level)
+
+
+@pytest.fixture
+def log_config() -> Iterator[LogConfig]:
+    """A fresh LogConfig whose file handler is closed after the test."""
+    config = LogConfig()
+    yield config
+    config.close()
+
+
 class TestLogConfig:
     """Test LogConfig class."""
 
@@ -55,39 +76,27 @@ class TestLogConfig:
         root_logger = logging.getLogger()
         assert root_logger.level == logging.INFO
 
-    def test_setup_file_handler(self):
+    def test_setup_file_handler(self, log_config, tmp_path):
         """Test setup with file output."""
-        with TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-
-            config = LogConfig()
-            config.setup(level=logging.INFO, log_file=log_file)
+        log_file = tmp_path / "test.log"
+        log_config.setup(level=logging.INFO, log_file=log_file)
 
-            # Log something
-            logger = logging.getLogger("test")
-            logger.info("Test message")
+        # Log something
+        logger = logging.getLogger("test")
+        logger.info("Test message")
 
-            # Verify file was created and contains message
-            assert log_file.exists()
-            content = log_file.read_text()
-            assert "Test message" in content
-            assert "test" in content  # Logger name
+        # Verify file was created and contains message
+        assert log_file.exists()
+        content = log_file.read_text()
+        assert "Test message" in content
+        assert "test" in content  # Logger name
 
-            # Clean up handlers before temp dir cleanup
-            config.close()
-
-    def test_file_handler_creates_directory(self):
+    def test_file_handler_creates_directory(self, log_config, tmp_path):
         """Test that setup creates parent directories for log file."""
-        with TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "logs" / "subdir" / "test.log"
-
-            config = LogConfig()
-            config.setup(level=logging.INFO, log_file=log_file)
-
-            assert log_file.parent.exists()
+        log_file = tmp_path / "logs" / "subdir" / "test.log"
+        log_config.setup(level=logging.INFO, log_file=log_file)
 
-            # Clean up handlers before temp dir cleanup
-            config.close()
+        assert log_file.parent.exists()
 
     def test_get_logger_caching(self):
         """Test that loggers are cached."""
@@ -98,30 +107,19 @@ class TestLogConfig:
 
         assert logger1 is logger2
 
-    def test_close_cleans_up(self):
+    def test_close_cleans_up(self, tmp_path):
         """Test that close() cleans up file handlers."""
-        with TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-
-            config = LogConfig()
-            config.setup(level=logging.INFO, log_file=log_file)
-            config.close()
+        config = LogConfig()
+        config.setup(level=logging.INFO, log_file=tmp_path / "test.log")
+        config.close()
 
-            # Should not raise an error
-            assert True
+        # Should not raise an error
+        assert True
 
 
 class TestGlobalLogging:
     """Test global logging functions."""
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        close_logging()
-        # Reset root logger
-        root = logging.getLogger()
-        for handler in root.handlers[:]:
-            root.removeHandler(handler)
-
     def test_init_logging_default(self):
         """Test init_logging with defaults."""
         init_logging()
@@ -153,35 +151,20 @@ class TestGlobalLogging:
         root_logger = logging.getLogger()
         assert root_logger.level >= logging.WARNING  # Should be initialized to WARNING
 
-    def test_logging_with_console_output(self):
+    def test_logging_with_console_output(self, capsys):
         """Test logging outputs to console."""
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            init_logging(level=logging.INFO)
-            logger = get_logger("test")
-            logger.info("Test console message")
+        init_logging(level=logging.INFO)
+        logger = get_logger("test")
+        logger.info("Test console message")
 
-            output = sys.stdout.getvalue()
-            assert "Test console message" in output
-            assert "test" in output
-        finally:
-            sys.stdout = old_stdout
+        output = capsys.readouterr().out
+        assert "Test console message" in output
+        assert "test" in output
 
 
 class TestLoggingIntegration:
     """Integration tests with actual modules."""
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        close_logging()
-        # Reset root logger
-        root = logging.getLogger()
-        for handler in root.handlers[:]:
-            root.removeHandler(handler)
-
     def test_assets_module_logging(self):
         """Test that assets module uses logging correctly."""
         init_logging(level=logging.DEBUG)
@@ -191,44 +174,30 @@ class TestLoggingIntegration:
         loader = get_loader()
         assert loader is not None
 
-    def test_verbose_debug_messages(self):
+    def test_verbose_debug_messages(self, capsys):
         """Test that DEBUG level enables all messages."""
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            init_logging(level=logging.DEBUG)
-            logger = get_logger("test")
-
-            logger.debug("Debug message")
-            logger.info("Info message")
-            logger.warning("Warning message")
-
-            output = sys.stdout.getvalue()
-            assert "Debug message" in output
-            assert "Info message" in output
-            assert "Warning message" in output
-        finally:
-            sys.stdout = old_stdout
-
-    def test_info_hides_debug_messages(self):
+        init_logging(level=logging.DEBUG)
+        logger = get_logger("test")
+
+        logger.debug("Debug message")
+        logger.info("Info message")
+        logger.warning("Warning message")
+
+        output = capsys.readouterr().out
+        assert "Debug message" in output
+        assert "Info message" in output
+        assert "Warning message" in output
+
+    def test_info_hides_debug_messages(self, capsys):
         """Test that INFO level hides DEBUG messages."""
-        # Capture stdout
-        old_stdout = sys.stdout
-        sys.stdout = StringIO()
-
-        try:
-            init_logging(level=logging.INFO)
-            logger = get_logger("test")
-
-            logger.warning("Warning message")
-            logger.debug("Debug message")
-            logger.info("Info message")
-
-            output = sys.stdout.getvalue()
-            assert "Debug message" not in output
-            assert "Info message" in output
-            assert "Warning message" in output
-        finally:
-            sys.stdout = old_stdout
+        init_logging(level=logging.INFO)
+        logger = get_logger("test")
+
+        logger.warning("Warning message")
+        logger.debug("Debug message")
+        logger.info("Info message")
+
+        output = capsys.readouterr().out
+        assert "Debug message" not in output
+        assert "Info message" in output
+        assert "Warning message" in output
@@ -3,11 +3,14 @@
 import unittest
 
 from chaser_game.mechanics.collision import check_catch_condition, clamp_entities_to_bounds
+from chaser_game.movement import distance
 
 
 class MockEntity:
     """Mock entity for testing collision functions."""
 
+    __slots__ = ("center_x", "center_y", "width", "height", "_clamped")
+
     def __init__(
         self,
         center_x: float = 0.0,
@@ -33,12 +36,18 @@ class MockEntity:
 class TestClampEntitiesToBounds(unittest.TestCase):
     """Test the clamp_entities_to_bounds function."""
 
+    WINDOW_WIDTH = 800.0
+    WINDOW_HEIGHT = 600.0
+    # MockEntity defaults to 32x32, so a centre stays half a width from each edge
+    HALF_WIDTH = 32.0 / 2
+    MAX_CENTER_X = WINDOW_WIDTH - HALF_WIDTH
+
     def test_clamps_both_entities(self) -> None:
         """Test that both entities are clamped."""
         mouse = MockEntity(center_x=100.0, center_y=100.0)
         kitten = MockEntity(center_x=100.0, center_y=100.0)
 
-        clamp_entities_to_bounds(mouse, kitten, 800.0, 600.0)
+        clamp_entities_to_bounds(mouse, kitten, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
 
         self.assertTrue(mouse._clamped)
         self.assertTrue(kitten._clamped)
@@ -48,20 +57,18 @@ class TestClampEntitiesToBounds(unittest.TestCase):
         mouse = MockEntity(center_x=-10.0, center_y=100.0)
         kitten = MockEntity(center_x=100.0, center_y=100.0)
 
-        clamp_entities_to_bounds(mouse, kitten, 800.0, 600.0)
+        clamp_entities_to_bounds(mouse, kitten, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
 
-        # center_x should be clamped to half_width (16.0)
-        self.assertEqual(mouse.center_x, 16.0)
+        self.assertEqual(mouse.center_x, self.HALF_WIDTH)
 
     def test_entity_outside_right_bound(self) -> None:
         """Test clamping entity outside right boundary."""
         mouse = MockEntity(center_x=900.0, center_y=100.0)
         kitten = MockEntity(center_x=100.0, center_y=100.0)
 
-        clamp_entities_to_bounds(mouse, kitten, 800.0, 600.0)
+        clamp_entities_to_bounds(mouse, kitten, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
 
-        # center_x should be clamped to (800 - 16) = 784
-        self.assertEqual(mouse.center_x, 784.0)
+        self.assertEqual(mouse.center_x, self.MAX_CENTER_X)
 
 
 class TestCheckCatchCondition(unittest.TestCase):
@@ -103,6 +110,33 @@ class TestCheckCatchCondition(unittest.TestCase):
 
         self.assertFalse(result)
 
+    def test_not_caught_exactly_at_range(self) -> None:
+        """Test that the catch range boundary itself is exclusive."""
+        mouse = MockEntity(center_x=0.0, center_y=0.0)
+        for kitten_x, kitten_y in ((50.0, 0.0), (0.0, -50.0), (30.0, 40.0)):
+            with self.subTest(kitten=(kitten_x, kitten_y)):
+                kitten = MockEntity(center_x=kitten_x, center_y=kitten_y)
+                self.assertFalse(check_catch_condition(mouse, kitten, catch_range=50.0))
+
+    def test_non_positive_range_never_catches(self) -> None:
+        """Test that a zero or negative catch range never reports a catch."""
+        mouse = MockEntity(center_x=0.0, center_y=0.0)
+        kitten = MockEntity(center_x=0.0, center_y=0.0)
+
+        self.assertFalse(check_catch_condition(mouse, kitten, catch_range=0.0))
+        self.assertFalse(check_catch_condition(mouse, kitten, catch_range=-1.0))
+
+    def test_matches_euclidean_distance(self) -> None:
+        """Test that the squared-distance check agrees with distance() on a grid of offsets."""
+        mouse = MockEntity(center_x=400.0, center_y=300.0)
+        kitten = MockEntity()
+        for dx in range(-60, 61, 3):
+            for dy in range(-60, 61, 3):
+                kitten.center_x = 400.0 + dx
+                kitten.center_y = 300.0 + dy
+                expected = distance(400.0, 300.0, kitten.center_x, kitten.center_y) < 50.0
+                self.assertEqual(check_catch_condition(mouse, kitten, catch_range=50.0), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
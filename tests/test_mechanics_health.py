@@ -9,6 +9,8 @@ from chaser_game.mechanics.health import update_health_stamina
 class MockEntity:
     """Mock entity for testing health/stamina updates."""
 
+    __slots__ = ("center_x", "center_y", "width", "height", "health", "stamina")
+
     def __init__(
         self,
         center_x: float = 0.0,
@@ -45,6 +47,15 @@ class TestUpdateHealthStamina(unittest.TestCase):
         # Health should not change (distance > catch_range)
         self.assertEqual(self.mouse.health, initial_health)
 
+    def test_no_damage_exactly_at_catch_range(self) -> None:
+        """Test that the catch range boundary itself deals no damage."""
+        self.kitten.center_x = 30.0
+        self.kitten.center_y = 40.0
+
+        update_health_stamina(self.mouse, self.kitten, catch_range=50.0, dt=1.0)
+
+        self.assertEqual(self.mouse.health, CONFIG.MAX_HEALTH)
+
     def test_passive_stamina_drain(self) -> None:
         """Test that stamina drains passively even when far away."""
         self.kitten.center_x = 500.0
@@ -57,6 +68,20 @@ class TestUpdateHealthStamina(unittest.TestCase):
         expected_drain = CONFIG.PASSIVE_STAMINA_DRAIN * 1.0
         self.assertAlmostEqual(self.kitten.stamina, initial_stamina - expected_drain, places=1)
 
+    def test_passive_drain_clamped_at_zero_when_far_apart(self) -> None:
+        """Test that out-of-range drain stops at zero and still clamps health into range."""
+        self.kitten.center_x = 500.0
+        cases = [(CONFIG.MAX_HEALTH + 50.0, CONFIG.MAX_HEALTH), (-10.0, 0.0)]
+        for health, expected_health in cases:
+            with self.subTest(health=health):
+                self.mouse.health = health
+                self.kitten.stamina = 0.5 * CONFIG.PASSIVE_STAMINA_DRAIN
+
+                update_health_stamina(self.mouse, self.kitten, catch_range=50.0, dt=1.0)
+
+                self.assertEqual(self.kitten.stamina, 0.0)
+                self.assertEqual(self.mouse.health, expected_health)
+
     def test_health_transfer_at_zero_distance(self) -> None:
         """Test maximum health transfer when at same position."""
         initial_health = self.mouse.health
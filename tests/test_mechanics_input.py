@@ -13,6 +13,8 @@ from pyglet.window import key, mouse
 class MockEntity:
     """Mock entity for testing input handling."""
 
+    __slots__ = ("keyboard_calls", "velocity_targets", "stopped")
+
     def __init__(self) -> None:
         self.keyboard_calls: list[tuple[bool, bool, bool, bool]] = []
         self.velocity_targets: list[tuple[float, float]] = []
@@ -32,45 +34,48 @@ class MockEntity:
 
 
 class MockKeyHandler:
-    """Mock pyglet KeyStateHandler."""
-
-    def __init__(self, keys: dict[int, bool] | None = None) -> None:
-        self._keys = keys or {}
-
-    def __getitem__(self, key_code: int) -> bool:
-        return self._keys.get(key_code, False)
+    """Mock pyglet KeyStateHandler holding the set of pressed keys."""
 
+    __slots__ = ("_pressed",)
 
-class TestHandleKeyboardInput(unittest.TestCase):
-    """Test the handle_keyboard_input function."""
+    def __init__(self, pressed: frozenset[int] = frozenset()) -> None:
+        self._pressed = pressed
 
-    def test_all_keys_released(self) -> None:
-        """Test when no keys are pressed."""
-        entity = MockEntity()
-        keys = MockKeyHandler({})
+    def __getitem__(self, key_code: int) -> bool:
+        return key_code in self._pressed
 
-        handle_keyboard_input(entity, keys)
 
-        self.assertEqual(len(entity.keyboard_calls), 1)
-        self.assertEqual(entity.keyboard_calls[0], (False, False, False, False))
+# Held keys -> (up, down, left, right) flags passed to update_from_keyboard
+_HELD_KEY_CASES: tuple[tuple[str, frozenset[int], tuple[bool, bool, bool, bool]], ...] = (
+    ("none", frozenset(), (False, False, False, False)),
+    ("up", frozenset({key.UP}), (True, False, False, False)),
+    ("down", frozenset({key.DOWN}), (False, True, False, False)),
+    ("left", frozenset({key.LEFT}), (False, False, True, False)),
+    ("right", frozenset({key.RIGHT}), (False, False, False, True)),
+    ("up_right", frozenset({key.UP, key.RIGHT}), (True, False, False, True)),
+)
 
-    def test_up_key_pressed(self) -> None:
-        """Test when up key is pressed."""
-        entity = MockEntity()
-        keys = MockKeyHandler({key.UP: True})
+# Diagonal shortcut key -> (up, down, left, right) flags it moves with
+_DIAGONAL_KEY_CASES: tuple[tuple[str, int, tuple[bool, bool, bool, bool]], ...] = (
+    ("HOME", key.HOME, (True, False, True, False)),
+    ("PAGEUP", key.PAGEUP, (True, False, False, True)),
+    ("END", key.END, (False, True, True, False)),
+    ("PAGEDOWN", key.PAGEDOWN, (False, True, False, True)),
+)
 
-        handle_keyboard_input(entity, keys)
 
-        self.assertEqual(entity.keyboard_calls[0], (True, False, False, False))
+class TestHandleKeyboardInput(unittest.TestCase):
+    """Test the handle_keyboard_input function."""
 
-    def test_diagonal_keys(self) -> None:
-        """Test when multiple keys are pressed for diagonal movement."""
-        entity = MockEntity()
-        keys = MockKeyHandler({key.UP: True, key.RIGHT: True})
+    def test_held_keys(self) -> None:
+        """Test that each held-key combination makes one call with matching flags."""
+        for name, held, expected in _HELD_KEY_CASES:
+            with self.subTest(name=name):
+                entity = MockEntity()
 
-        handle_keyboard_input(entity, keys)
+                handle_keyboard_input(entity, MockKeyHandler(held))
 
-        self.assertEqual(entity.keyboard_calls[0], (True, False, False, True))
+                self.assertEqual(entity.keyboard_calls, [expected])
 
     def test_handles_invalid_keys_gracefully(self) -> None:
         """Test that invalid key handlers don't crash."""
@@ -86,37 +91,15 @@ class TestHandleKeyboardInput(unittest.TestCase):
 class TestHandleKeyPress(unittest.TestCase):
     """Test the handle_key_press function."""
 
-    def test_home_key_up_left(self) -> None:
-        """Test HOME key for up-left diagonal."""
-        entity = MockEntity()
-
-        handle_key_press(entity, key.HOME)
-
-        self.assertEqual(entity.keyboard_calls[0], (True, False, True, False))
-
-    def test_pageup_key_up_right(self) -> None:
-        """Test PAGEUP key for up-right diagonal."""
-        entity = MockEntity()
-
-        handle_key_press(entity, key.PAGEUP)
-
-        self.assertEqual(entity.keyboard_calls[0], (True, False, False, True))
-
-    def test_end_key_down_left(self) -> None:
-        """Test END key for down-left diagonal."""
-        entity = MockEntity()
-
-        handle_key_press(entity, key.END)
-
-        self.assertEqual(entity.keyboard_calls[0], (False, True, True, False))
-
-    def test_pagedown_key_down_right(self) -> None:
-        """Test PAGEDOWN key for down-right diagonal."""
-        entity = MockEntity()
+    def test_diagonal_keys(self) -> None:
+        """Test HOME, PAGEUP, END and PAGEDOWN move along their diagonals."""
+        for name, symbol, expected in _DIAGONAL_KEY_CASES:
+            with self.subTest(key=name):
+                entity = MockEntity()
 
-        handle_key_press(entity, key.PAGEDOWN)
+                handle_key_press(entity, symbol)
 
-        self.assertEqual(entity.keyboard_calls[0], (False, True, False, True))
+                self.assertEqual(entity.keyboard_calls, [expected])
 
     def test_space_key_stops_entity(self) -> None:
         """Test SPACE key stops the entity."""
@@ -4,9 +4,11 @@ Tests pure functions for vector math, keyboard input, mouse click handling,
 and chase AI behavior.
 """
 
+import itertools
 import math
 import unittest
 
+import pytest
 from chaser_game.movement import (
     Vector2,
     apply_speed_to_direction,
@@ -21,362 +23,366 @@ from chaser_game.movement import (
     update_position,
 )
 
+DIAGONAL_100 = 100.0 * math.sqrt(0.5)
 
-class TestDistance(unittest.TestCase):
-    """Tests for distance calculation."""
-
-    def test_distance_same_point(self) -> None:
-        """Distance between same point should be zero."""
-        self.assertEqual(distance(0, 0, 0, 0), 0.0)
-        self.assertEqual(distance(5, 5, 5, 5), 0.0)
-
-    def test_distance_horizontal(self) -> None:
-        """Distance between points on same horizontal line."""
-        self.assertEqual(distance(0, 0, 3, 0), 3.0)
-        self.assertEqual(distance(10, 5, 13, 5), 3.0)
-
-    def test_distance_vertical(self) -> None:
-        """Distance between points on same vertical line."""
-        self.assertEqual(distance(0, 0, 0, 4), 4.0)
-        self.assertEqual(distance(5, 10, 5, 14), 4.0)
-
-    def test_distance_3_4_5_triangle(self) -> None:
-        """Distance in a 3-4-5 right triangle."""
-        self.assertAlmostEqual(distance(0, 0, 3, 4), 5.0)
-        self.assertAlmostEqual(distance(0, 0, 4, 3), 5.0)
-
-    def test_distance_negative_coordinates(self) -> None:
-        """Distance works with negative coordinates."""
-        self.assertAlmostEqual(distance(-1, -1, 2, 3), 5.0)
-        self.assertEqual(distance(-5, 0, 5, 0), 10.0)
-
-
-class TestNormalizeVector(unittest.TestCase):
-    """Tests for vector normalization."""
-
-    def test_normalize_zero_vector(self) -> None:
-        """Normalizing zero vector returns zero."""
-        result = normalize_vector(0, 0)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_normalize_unit_vector(self) -> None:
-        """Normalizing a unit vector should return itself."""
-        result = normalize_vector(1, 0)
-        self.assertAlmostEqual(result.x, 1.0)
-        self.assertAlmostEqual(result.y, 0.0)
-
-    def test_normalize_scales_to_unit_length(self) -> None:
-        """Normalized vector should have length 1."""
-        result = normalize_vector(3, 4)
-        length = math.sqrt(result.x * result.x + result.y * result.y)
-        self.assertAlmostEqual(length, 1.0)
-
-    def test_normalize_3_4_5_triangle(self) -> None:
-        """Normalize a 3-4-5 triangle."""
-        result = normalize_vector(3, 4)
-        self.assertAlmostEqual(result.x, 0.6)
-        self.assertAlmostEqual(result.y, 0.8)
-
-    def test_normalize_preserves_direction(self) -> None:
-        """Normalized vector points in same direction."""
-        result = normalize_vector(5, 0)
-        self.assertGreater(result.x, 0)
-        self.assertEqual(result.y, 0)
-
-        result = normalize_vector(0, -5)
-        self.assertEqual(result.x, 0)
-        self.assertLess(result.y, 0)
-
-    def test_normalize_negative_values(self) -> None:
-        """Normalize handles negative values."""
-        result = normalize_vector(-3, -4)
-        length = math.sqrt(result.x * result.x + result.y * result.y)
-        self.assertAlmostEqual(length, 1.0)
-
-
-class TestApplySpeedToDirection(unittest.TestCase):
-    """Tests for applying speed to a direction vector."""
-
-    def test_apply_speed_to_unit_vector(self) -> None:
-        """Apply speed to normalized direction."""
-        result = apply_speed_to_direction(1, 0, 10)
-        self.assertEqual(result, Vector2(10.0, 0.0))
-
-    def test_apply_speed_zero_direction(self) -> None:
-        """Zero direction with speed returns zero."""
-        result = apply_speed_to_direction(0, 0, 10)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_apply_speed_diagonal(self) -> None:
-        """Apply speed to diagonal direction."""
-        result = apply_speed_to_direction(0.6, 0.8, 10)
-        self.assertAlmostEqual(result.x, 6.0)
-        self.assertAlmostEqual(result.y, 8.0)
-
-    def test_apply_speed_negative_speed(self) -> None:
-        """Negative speed reverses direction."""
-        result = apply_speed_to_direction(1, 0, -10)
-        self.assertEqual(result, Vector2(-10.0, 0.0))
-
-
-class TestCalculateKeyboardVelocity(unittest.TestCase):
-    """Tests for keyboard input velocity calculation."""
-
-    def test_no_input(self) -> None:
-        """No keys pressed returns zero velocity."""
-        result = calculate_keyboard_velocity(False, False, False, False, 100)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_single_direction_up(self) -> None:
-        """Up key only."""
-        result = calculate_keyboard_velocity(True, False, False, False, 100)
-        self.assertEqual(result, Vector2(0.0, 100.0))
-
-    def test_single_direction_down(self) -> None:
-        """Down key only."""
-        result = calculate_keyboard_velocity(False, True, False, False, 100)
-        self.assertEqual(result, Vector2(0.0, -100.0))
-
-    def test_single_direction_left(self) -> None:
-        """Left key only."""
-        result = calculate_keyboard_velocity(False, False, True, False, 100)
-        self.assertEqual(result, Vector2(-100.0, 0.0))
-
-    def test_single_direction_right(self) -> None:
-        """Right key only."""
-        result = calculate_keyboard_velocity(False, False, False, True, 100)
-        self.assertEqual(result, Vector2(100.0, 0.0))
-
-    def test_opposite_directions_cancel(self) -> None:
-        """Opposite directions cancel out."""
-        result = calculate_keyboard_velocity(True, True, False, False, 100)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-        result = calculate_keyboard_velocity(False, False, True, True, 100)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_diagonal_up_right(self) -> None:
-        """Up + Right with default diagonal factor."""
-        result = calculate_keyboard_velocity(True, False, False, True, 100)
-        # Each should be speed * diagonal_factor (0.7071)
-        expected_component = 100.0 * 0.7071
-        self.assertAlmostEqual(result.x, expected_component, places=3)
-        self.assertAlmostEqual(result.y, expected_component, places=3)
-
-    def test_diagonal_down_left(self) -> None:
-        """Down + Left with default diagonal factor."""
-        result = calculate_keyboard_velocity(False, True, True, False, 100)
-        expected_component = 100.0 * 0.7071
-        self.assertAlmostEqual(result.x, -expected_component, places=3)
-        self.assertAlmostEqual(result.y, -expected_component, places=3)
-
-    def test_custom_diagonal_factor(self) -> None:
-        """Diagonal factor can be customized."""
-        result = calculate_keyboard_velocity(True, False, True, False, 100, diagonal_factor=0.5)
-        self.assertAlmostEqual(result.x, -50.0)
-        self.assertAlmostEqual(result.y, 50.0)
-
-
-class TestCalculateClickVelocity(unittest.TestCase):
-    """Tests for mouse click velocity calculation."""
-
-    def test_click_same_position(self) -> None:
-        """Click at current position returns zero velocity."""
-        result = calculate_click_velocity(10, 10, 10, 10, 100)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_click_right(self) -> None:
-        """Click to the right."""
-        result = calculate_click_velocity(0, 0, 10, 0, 100)
-        self.assertAlmostEqual(result.x, 100.0)
-        self.assertAlmostEqual(result.y, 0.0)
-
-    def test_click_diagonal(self) -> None:
-        """Click diagonally."""
-        result = calculate_click_velocity(0, 0, 3, 4, 10)
-        # Normalized direction is (0.6, 0.8), apply speed 10
-        self.assertAlmostEqual(result.x, 6.0)
-        self.assertAlmostEqual(result.y, 8.0)
-
-    def test_click_negative_coordinates(self) -> None:
-        """Click from negative coordinates."""
-        result = calculate_click_velocity(-10, -10, -7, -6, 10)
-        # Direction: (3, 4), normalized: (0.6, 0.8)
-        self.assertAlmostEqual(result.x, 6.0)
-        self.assertAlmostEqual(result.y, 8.0)
-
-
-class TestUpdatePosition(unittest.TestCase):
-    """Tests for position update with velocity."""
-
-    def test_no_velocity(self) -> None:
-        """No velocity means no change."""
-        result = update_position(10, 20, 0, 0, 1.0)
-        self.assertEqual(result, Vector2(10.0, 20.0))
-
-    def test_simple_movement(self) -> None:
-        """Simple movement with unit velocity and time."""
-        result = update_position(0, 0, 10, 20, 1.0)
-        self.assertEqual(result, Vector2(10.0, 20.0))
-
-    def test_movement_with_time_scale(self) -> None:
-        """Movement scales with delta time."""
-        result = update_position(0, 0, 10, 20, 0.5)
-        self.assertEqual(result, Vector2(5.0, 10.0))
-
-    def test_negative_velocity(self) -> None:
-        """Negative velocity moves backward."""
-        result = update_position(100, 100, -10, -20, 1.0)
-        self.assertEqual(result, Vector2(90.0, 80.0))
-
-    def test_fractional_time(self) -> None:
-        """Fractional delta time (60Hz frame: 1/60)."""
-        result = update_position(0, 0, 60, 120, 1 / 60)
-        self.assertAlmostEqual(result.x, 1.0)
-        self.assertAlmostEqual(result.y, 2.0)
-
-
-class TestClampToBounds(unittest.TestCase):
-    """Tests for position clamping to bounds."""
-
-    def test_position_in_bounds(self) -> None:
-        """Position already in bounds is unchanged."""
-        result = clamp_to_bounds(50, 50, 200, 200, 10, 10)
-        self.assertEqual(result, Vector2(50.0, 50.0))
-
-    def test_clamp_left_edge(self) -> None:
-        """Clamp to left edge."""
-        result = clamp_to_bounds(-5, 50, 200, 200, 10, 10)
-        self.assertEqual(result.x, 0.0)
-        self.assertEqual(result.y, 50.0)
-
-    def test_clamp_right_edge(self) -> None:
-        """Clamp to right edge."""
-        result = clamp_to_bounds(195, 50, 200, 200, 10, 10)
-        self.assertEqual(result.x, 190.0)
-        self.assertEqual(result.y, 50.0)
-
-    def test_clamp_bottom_edge(self) -> None:
-        """Clamp to bottom edge."""
-        result = clamp_to_bounds(50, -5, 200, 200, 10, 10)
-        self.assertEqual(result.x, 50.0)
-        self.assertEqual(result.y, 0.0)
-
-    def test_clamp_top_edge(self) -> None:
-        """Clamp to top edge."""
-        result = clamp_to_bounds(50, 195, 200, 200, 10, 10)
-        self.assertEqual(result.x, 50.0)
-        self.assertEqual(result.y, 190.0)
-
-    def test_clamp_corner(self) -> None:
-        """Clamp at corner."""
-        result = clamp_to_bounds(-10, -10, 200, 200, 10, 10)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_clamp_accounts_for_sprite_size(self) -> None:
-        """Sprite size affects clamping boundary."""
-        # Sprite is 20x20 in 200x200 area
-        result = clamp_to_bounds(185, 185, 200, 200, 20, 20)
-        self.assertEqual(result.x, 180.0)
-        self.assertEqual(result.y, 180.0)
-
-
-class TestCalculateChaseVelocity(unittest.TestCase):
-    """Tests for chase AI velocity calculation."""
-
-    def test_chase_stationary_at_target(self) -> None:
-        """At target (within threshold) returns zero velocity."""
-        result = calculate_chase_velocity(10, 10, 10, 10, 100, distance_threshold=2.0)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_chase_within_threshold(self) -> None:
-        """Distance less than threshold returns zero."""
-        result = calculate_chase_velocity(10, 10, 11, 11, 100, distance_threshold=2.0)
+
+@pytest.mark.parametrize(
+    ("x1", "y1", "x2", "y2", "expected"),
+    [
+        pytest.param(0, 0, 0, 0, 0.0, id="origin"),
+        pytest.param(5, 5, 5, 5, 0.0, id="same_point"),
+        pytest.param(0, 0, 3, 0, 3.0, id="horizontal"),
+        pytest.param(10, 5, 13, 5, 3.0, id="horizontal_offset"),
+        pytest.param(0, 0, 0, 4, 4.0, id="vertical"),
+        pytest.param(5, 10, 5, 14, 4.0, id="vertical_offset"),
+        pytest.param(-5, 0, 5, 0, 10.0, id="across_origin"),
+    ],
+)
+def test_distance_exact(x1: float, y1: float, x2: float, y2: float, expected: float) -> None:
+    """Axis-aligned distances are exact."""
+    assert distance(x1, y1, x2, y2) == expected
+
+
+@pytest.mark.parametrize(
+    ("x1", "y1", "x2", "y2"),
+    [
+        pytest.param(0, 0, 3, 4, id="3_4_5"),
+        pytest.param(0, 0, 4, 3, id="4_3_5"),
+        pytest.param(-1, -1, 2, 3, id="negative"),
+    ],
+)
+def test_distance_3_4_5_triangle(x1: float, y1: float, x2: float, y2: float) -> None:
+    """Distance in a 3-4-5 right triangle."""
+    assert distance(x1, y1, x2, y2) == pytest.approx(5.0)
+
+
+def test_distance_large_components() -> None:
+    """Distance does not overflow when squared components would."""
+    assert distance(0, 0, 3e200, 4e200) / 5e200 == pytest.approx(1.0)
+
+
+def test_normalize_zero_vector() -> None:
+    """Normalizing zero vector returns zero."""
+    assert normalize_vector(0, 0) == Vector2(0.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("dx", "dy", "expected"),
+    [
+        pytest.param(1, 0, (1.0, 0.0), id="unit"),
+        pytest.param(3, 4, (0.6, 0.8), id="3_4_5"),
+        pytest.param(-3, -4, (-0.6, -0.8), id="negative"),
+    ],
+)
+def test_normalize_vector(dx: float, dy: float, expected: tuple[float, float]) -> None:
+    """Normalized vectors point the same way with unit length."""
+    result = normalize_vector(dx, dy)
+    assert result == pytest.approx(expected)
+    assert math.hypot(*result) == pytest.approx(1.0)
+
+
+def test_normalize_preserves_direction() -> None:
+    """Normalized vector points in same direction."""
+    result = normalize_vector(5, 0)
+    assert result.x > 0
+    assert result.y == 0
+
+    result = normalize_vector(0, -5)
+    assert result.x == 0
+    assert result.y < 0
+
+
+@pytest.mark.parametrize(
+    ("direction", "speed", "expected"),
+    [
+        pytest.param((1, 0), 10, Vector2(10.0, 0.0), id="unit"),
+        pytest.param((0, 0), 10, Vector2(0.0, 0.0), id="zero_direction"),
+        pytest.param((1, 0), -10, Vector2(-10.0, 0.0), id="negative_speed"),
+    ],
+)
+def test_apply_speed_to_direction(
+    direction: tuple[float, float], speed: float, expected: Vector2
+) -> None:
+    """Speed scales the direction components."""
+    assert apply_speed_to_direction(*direction, speed) == expected
+
+
+def test_apply_speed_diagonal() -> None:
+    """Apply speed to diagonal direction."""
+    assert apply_speed_to_direction(0.6, 0.8, 10) == pytest.approx((6.0, 8.0))
+
+
+@pytest.mark.parametrize(
+    ("keys", "expected"),
+    [
+        pytest.param((False, False, False, False), Vector2(0.0, 0.0), id="none"),
+        pytest.param((True, False, False, False), Vector2(0.0, 100.0), id="up"),
+        pytest.param((False, True, False, False), Vector2(0.0, -100.0), id="down"),
+        pytest.param((False, False, True, False), Vector2(-100.0, 0.0), id="left"),
+        pytest.param((False, False, False, True), Vector2(100.0, 0.0), id="right"),
+        pytest.param((True, True, False, False), Vector2(0.0, 0.0), id="up_down_cancel"),
+        pytest.param((False, False, True, True), Vector2(0.0, 0.0), id="left_right_cancel"),
+        pytest.param((True, False, False, True), Vector2(DIAGONAL_100, DIAGONAL_100), id="up_right"),
+        pytest.param(
+            (False, True, True, False), Vector2(-DIAGONAL_100, -DIAGONAL_100), id="down_left"
+        ),
+    ],
+)
+def test_keyboard_velocity(keys: tuple[bool, bool, bool, bool], expected: Vector2) -> None:
+    """Keys map to cardinal or 1/sqrt(2)-scaled diagonal velocity at speed 100."""
+    assert calculate_keyboard_velocity(*keys, 100) == expected
+
+
+def test_keyboard_custom_diagonal_factor() -> None:
+    """Diagonal factor can be customized."""
+    result = calculate_keyboard_velocity(True, False, True, False, 100, diagonal_factor=0.5)
+    assert result == pytest.approx((-50.0, 50.0))
+
+
+@pytest.mark.parametrize("keys", list(itertools.product((False, True), repeat=4)))
+def test_keyboard_all_key_combinations(keys: tuple[bool, bool, bool, bool]) -> None:
+    """Every key combination scales its direction by speed, diagonals by the factor."""
+    up, down, left, right = keys
+    vx = (float(right) - float(left)) * 10.0
+    vy = (float(up) - float(down)) * 10.0
+    if (up or down) and (left or right):
+        vx *= 0.5
+        vy *= 0.5
+    assert calculate_keyboard_velocity(*keys, 10.0, 0.5) == Vector2(vx, vy)
+
+
+def test_keyboard_results_depend_on_speed_and_factor() -> None:
+    """Results scale with speed and the diagonal factor, not just the keys."""
+    assert calculate_keyboard_velocity(True, False, False, True, 50) == Vector2(
+        50 * math.sqrt(0.5), 50 * math.sqrt(0.5)
+    )
+    assert calculate_keyboard_velocity(True, False, False, True, 100, diagonal_factor=1.0) == Vector2(
+        100.0, 100.0
+    )
+
+
+def test_click_same_position() -> None:
+    """Click at current position returns zero velocity."""
+    assert calculate_click_velocity(10, 10, 10, 10, 100) == Vector2(0.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("current", "target", "speed", "expected"),
+    [
+        pytest.param((0, 0), (10, 0), 100, (100.0, 0.0), id="right"),
+        pytest.param((0, 0), (3, 4), 10, (6.0, 8.0), id="diagonal"),
+        pytest.param((-10, -10), (-7, -6), 10, (6.0, 8.0), id="negative_coordinates"),
+    ],
+)
+def test_click_velocity(
+    current: tuple[float, float],
+    target: tuple[float, float],
+    speed: float,
+    expected: tuple[float, float],
+) -> None:
+    """Click velocity heads toward the target at the given speed."""
+    assert calculate_click_velocity(*current, *target, speed) == pytest.approx(expected)
+
+
+def test_click_matches_normalize_then_scale() -> None:
+    """Click velocity is bit-identical to normalizing and then applying speed."""
+    direction = normalize_vector(7.0 - 1.5, -2.0 - 4.25)
+    expected = apply_speed_to_direction(direction.x, direction.y, 13.0)
+    assert calculate_click_velocity(1.5, 4.25, 7.0, -2.0, 13.0) == expected
+
+
+@pytest.mark.parametrize(
+    ("position", "velocity", "dt", "expected"),
+    [
+        pytest.param((10, 20), (0, 0), 1.0, Vector2(10.0, 20.0), id="no_velocity"),
+        pytest.param((0, 0), (10, 20), 1.0, Vector2(10.0, 20.0), id="simple"),
+        pytest.param((0, 0), (10, 20), 0.5, Vector2(5.0, 10.0), id="time_scale"),
+        pytest.param((100, 100), (-10, -20), 1.0, Vector2(90.0, 80.0), id="negative_velocity"),
+    ],
+)
+def test_update_position(
+    position: tuple[float, float], velocity: tuple[float, float], dt: float, expected: Vector2
+) -> None:
+    """Position advances by velocity * dt."""
+    assert update_position(*position, *velocity, dt) == expected
+
+
+def test_update_position_fractional_time() -> None:
+    """Fractional delta time (60Hz frame: 1/60)."""
+    assert update_position(0, 0, 60, 120, 1 / 60) == pytest.approx((1.0, 2.0))
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "expected"),
+    [
+        pytest.param(50, 50, Vector2(50.0, 50.0), id="in_bounds"),
+        pytest.param(-5, 50, Vector2(0.0, 50.0), id="left_edge"),
+        pytest.param(195, 50, Vector2(190.0, 50.0), id="right_edge"),
+        pytest.param(50, -5, Vector2(50.0, 0.0), id="bottom_edge"),
+        pytest.param(50, 195, Vector2(50.0, 190.0), id="top_edge"),
+        pytest.param(-10, -10, Vector2(0.0, 0.0), id="corner"),
+    ],
+)
+def test_clamp_to_bounds(x: float, y: float, expected: Vector2) -> None:
+    """Clamp a 10x10 sprite to a 200x200 area."""
+    assert clamp_to_bounds(x, y, 200, 200, 10, 10) == expected
+
+
+def test_clamp_accounts_for_sprite_size() -> None:
+    """Sprite size affects clamping boundary."""
+    # Sprite is 20x20 in 200x200 area
+    assert clamp_to_bounds(185, 185, 200, 200, 20, 20) == Vector2(180.0, 180.0)
+
+
+@pytest.mark.parametrize(
+    ("current", "target", "speed", "threshold", "metric"),
+    [
+        pytest.param((10, 10), (10, 10), 100, 2.0, "euclidean", id="at_target"),
         # sqrt(2) ≈ 1.41 < 2.0
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_chase_beyond_threshold(self) -> None:
-        """Distance beyond threshold returns movement."""
-        result = calculate_chase_velocity(0, 0, 3, 4, 10, distance_threshold=1.0)
-        # Direction: (0.6, 0.8), speed: 10
-        self.assertAlmostEqual(result.x, 6.0)
-        self.assertAlmostEqual(result.y, 8.0)
-
-    def test_chase_high_threshold(self) -> None:
-        """Large threshold prevents movement."""
-        result = calculate_chase_velocity(0, 0, 100, 100, 10, distance_threshold=1000.0)
-        self.assertEqual(result, Vector2(0.0, 0.0))
-
-    def test_chase_custom_speed(self) -> None:
-        """Chase respects custom speed."""
-        result = calculate_chase_velocity(0, 0, 3, 4, 20, distance_threshold=1.0)
-        self.assertAlmostEqual(result.x, 12.0)
-        self.assertAlmostEqual(result.y, 16.0)
-
-
-class TestApplyTravelDistance(unittest.TestCase):
-    """Tests for fixed-distance movement toward target."""
-
-    def test_travel_distance_less_than_target(self) -> None:
-        """Travel distance less than distance to target."""
-        result = apply_travel_distance(0, 0, 10, 0, 3)
-        self.assertAlmostEqual(result.x, 3.0)
-        self.assertAlmostEqual(result.y, 0.0)
-
-    def test_travel_distance_more_than_target(self) -> None:
-        """Travel distance more than distance to target stops at target."""
-        result = apply_travel_distance(0, 0, 3, 4, 100)
-        self.assertAlmostEqual(result.x, 3.0)
-        self.assertAlmostEqual(result.y, 4.0)
-
-    def test_travel_distance_zero(self) -> None:
-        """Zero travel distance means no movement."""
-        result = apply_travel_distance(10, 10, 20, 20, 0)
-        self.assertEqual(result, Vector2(10.0, 10.0))
-
-    def test_travel_distance_to_same_position(self) -> None:
-        """Travel distance when already at target."""
-        result = apply_travel_distance(10, 10, 10, 10, 5)
-        self.assertEqual(result, Vector2(10.0, 10.0))
-
-    def test_travel_distance_diagonal(self) -> None:
-        """Travel distance toward diagonal target."""
-        result = apply_travel_distance(0, 0, 3, 4, 2.5)
+        pytest.param((10, 10), (11, 11), 100, 2.0, "euclidean", id="within_threshold"),
+        # Exactly at threshold returns zero velocity (uses <=)
+        pytest.param((0, 0), (0, 2), 10, 2.0, "euclidean", id="exactly_threshold"),
+        pytest.param((0, 0), (100, 100), 10, 1000.0, "euclidean", id="high_threshold"),
+        pytest.param((0, 0), (1, 1), 10, 2.0, "manhattan", id="manhattan_within_threshold"),
+    ],
+)
+def test_chase_stops(
+    current: tuple[float, float],
+    target: tuple[float, float],
+    speed: float,
+    threshold: float,
+    metric: str,
+) -> None:
+    """Chasing a target at or within the threshold returns zero velocity."""
+    result = calculate_chase_velocity(
+        *current, *target, speed, distance_threshold=threshold, metric=metric
+    )
+    assert result == Vector2(0.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("speed", "threshold", "metric", "expected"),
+    [
+        # Direction: (0.6, 0.8)
+        pytest.param(10, 1.0, "euclidean", (6.0, 8.0), id="beyond_threshold"),
+        pytest.param(20, 1.0, "euclidean", (12.0, 16.0), id="custom_speed"),
+        # Manhattan scales the direction by |dx| + |dy|
+        pytest.param(7, 2.0, "manhattan", (3.0, 4.0), id="manhattan_diagonal"),
+    ],
+)
+def test_chase_moves_toward_target(
+    speed: float, threshold: float, metric: str, expected: tuple[float, float]
+) -> None:
+    """Chasing from the origin toward (3, 4) beyond the threshold."""
+    result = calculate_chase_velocity(0, 0, 3, 4, speed, distance_threshold=threshold, metric=metric)
+    assert result == pytest.approx(expected)
+
+
+def test_chase_manhattan_cardinal() -> None:
+    """Manhattan chase along an axis moves at full speed."""
+    assert calculate_chase_velocity(0, 0, 0, 10, 5, metric="manhattan") == Vector2(0.0, 5.0)
+
+
+def test_chase_unknown_metric() -> None:
+    """Unknown metrics are rejected."""
+    with pytest.raises(ValueError):
+        calculate_chase_velocity(0, 0, 3, 4, 10, metric="chebyshev")  # type: ignore[arg-type]
+
+
+def test_chase_zero_results_share_one_vector() -> None:
+    """Zero-velocity results are the same immutable Vector2 instance."""
+    at_target = calculate_chase_velocity(10, 10, 10, 10, 100)
+    within = calculate_chase_velocity(0, 0, 1, 1, 10, metric="manhattan")
+    assert at_target is within
+    assert calculate_click_velocity(5, 5, 5, 5, 10) is at_target
+
+
+@pytest.mark.parametrize(
+    ("current", "target", "travel", "expected"),
+    [
+        pytest.param((0, 0), (10, 0), 3, (3.0, 0.0), id="less_than_target"),
+        pytest.param((0, 0), (3, 4), 100, (3.0, 4.0), id="more_than_target"),
         # Distance to target is 5, travel 2.5 which is 50%
-        self.assertAlmostEqual(result.x, 1.5)
-        self.assertAlmostEqual(result.y, 2.0)
+        pytest.param((0, 0), (3, 4), 2.5, (1.5, 2.0), id="diagonal"),
+    ],
+)
+def test_travel_distance(
+    current: tuple[float, float],
+    target: tuple[float, float],
+    travel: float,
+    expected: tuple[float, float],
+) -> None:
+    """Travel moves toward the target and stops on it."""
+    assert apply_travel_distance(*current, *target, travel) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("target", "travel"),
+    [
+        pytest.param((20, 20), 0, id="zero_travel"),
+        pytest.param((10, 10), 5, id="at_target"),
+        pytest.param((20, 20), -5, id="negative_travel"),
+    ],
+)
+def test_travel_distance_stays_put(target: tuple[float, float], travel: float) -> None:
+    """No travel, or no distance to cover, leaves the position unchanged."""
+    assert apply_travel_distance(10, 10, *target, travel) == Vector2(10.0, 10.0)
 
 
-class TestIsMoving(unittest.TestCase):
-    """Tests for movement state detection."""
+@pytest.mark.parametrize("travel", [5.0, 5.0 + 1e-9, 1e6])
+def test_travel_distance_snaps_to_target(travel: float) -> None:
+    """Reaching or overshooting the target lands exactly on it."""
+    assert apply_travel_distance(0.1, 0.2, 3.1, 4.2, travel) == Vector2(3.1, 4.2)
 
-    def test_is_moving_at_target(self) -> None:
-        """At target is not moving."""
-        result = is_moving(10, 10, 10, 10, distance_threshold=2.0)
-        self.assertFalse(result)
 
-    def test_is_moving_within_threshold(self) -> None:
-        """Within threshold is not moving."""
-        result = is_moving(10, 10, 11, 11, distance_threshold=2.0)
-        # sqrt(2) ≈ 1.41 < 2.0
-        self.assertFalse(result)
+def test_travel_matches_distance_and_normalize() -> None:
+    """Travel is bit-identical to stepping along the normalized direction."""
+    direction = normalize_vector(7.0 - 1.5, -2.0 - 4.25)
+    step = min(3.0, distance(1.5, 4.25, 7.0, -2.0))
+    expected = Vector2(1.5 + direction.x * step, 4.25 + direction.y * step)
+    assert apply_travel_distance(1.5, 4.25, 7.0, -2.0, 3.0) == expected
 
-    def test_is_moving_beyond_threshold(self) -> None:
-        """Beyond threshold is moving."""
-        result = is_moving(0, 0, 3, 4, distance_threshold=1.0)
-        # Distance is 5 > 1.0
-        self.assertTrue(result)
 
-    def test_is_moving_exactly_threshold(self) -> None:
-        """Exactly at threshold is not moving (uses >)."""
-        result = is_moving(0, 0, 2, 0, distance_threshold=2.0)
+@pytest.mark.parametrize(
+    ("current", "target", "threshold", "metric", "expected"),
+    [
+        pytest.param((10, 10), (10, 10), 2.0, "euclidean", False, id="at_target"),
+        # sqrt(2) ≈ 1.41 < 2.0
+        pytest.param((10, 10), (11, 11), 2.0, "euclidean", False, id="within_threshold"),
+        # Distance is 5 > 1.0
+        pytest.param((0, 0), (3, 4), 1.0, "euclidean", True, id="beyond_threshold"),
         # Distance is exactly 2.0, not > 2.0
-        self.assertFalse(result)
-
-    def test_is_moving_just_beyond_threshold(self) -> None:
-        """Just beyond threshold is moving."""
-        result = is_moving(0, 0, 2.1, 0, distance_threshold=2.0)
-        self.assertTrue(result)
+        pytest.param((0, 0), (2, 0), 2.0, "euclidean", False, id="exactly_threshold"),
+        pytest.param((0, 0), (2.1, 0), 2.0, "euclidean", True, id="just_beyond_threshold"),
+        # Euclidean distance sqrt(2) is within 2.0, Manhattan distance 2.0 is not beyond it
+        pytest.param((0, 0), (1, 1), 2.0, "manhattan", False, id="manhattan_at_threshold"),
+        # Euclidean distance ~1.56 is within 2.0, Manhattan distance 2.2 is beyond it
+        pytest.param((0, 0), (1.1, 1.1), 2.0, "manhattan", True, id="manhattan_beyond"),
+        pytest.param((0, 0), (1.1, 1.1), 2.0, "euclidean", False, id="euclidean_within"),
+    ],
+)
+def test_is_moving(
+    current: tuple[float, float],
+    target: tuple[float, float],
+    threshold: float,
+    metric: str,
+    expected: bool,
+) -> None:
+    """Moving means strictly beyond the threshold under the chosen metric."""
+    assert is_moving(*current, *target, distance_threshold=threshold, metric=metric) is expected
+
+
+def test_is_moving_unknown_metric() -> None:
+    """Unknown metrics are rejected."""
+    with pytest.raises(ValueError):
+        is_moving(0, 0, 3, 4, metric="chebyshev")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("dy", [-2.0, -1.2, 0.0, 1.2, 2.0])
+@pytest.mark.parametrize("dx", [-2.5, -2.0, -1.5, 0.0, 1.5, 2.0, 2.5])
+def test_is_moving_matches_euclidean_distance(dx: float, dy: float) -> None:
+    """Squared-distance check agrees with distance() around the threshold."""
+    assert is_moving(0, 0, dx, dy, distance_threshold=2.0) == (distance(0, 0, dx, dy) > 2.0)
 
 
 class TestIntegration(unittest.TestCase):
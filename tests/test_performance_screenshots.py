@@ -1,55 +1,120 @@
 """Performance tests for screenshot capture."""
 
-import unittest
+import ctypes
+import gc
+import statistics
+import time
+from collections.abc import Callable, Iterator
 from unittest.mock import MagicMock, patch
 
+import pytest
 from chaser_game.screen_manager import ScreenManager
+from chaser_game.screens import ScreenName
+from chaser_game.screens.base import ScreenProtocol
+from chaser_game.utils.pbo import PBOManager
 
+CAPTURE_BUDGET_US = 2000.0
+CAPTURE_WARMUP = 20
+CAPTURE_SAMPLES = 200
+# on_draw runs every frame; with no capture queued its gating logic must stay cheap
+DRAW_BUDGET_US = 100.0
 
-class TestScreenshotPerformance(unittest.TestCase):
-    """Benchmarks and constraints for screenshot performance."""
-
-    def setUp(self) -> None:
-        self.mock_window = MagicMock()
-        self.mock_window.width = 800
-        self.mock_window.height = 600
-
-        # Patch PBOManager to use REAL time measurement logic but mock GL calls
-        # We need to test the ScreenManager integration of the metric
-        with patch("chaser_game.screen_manager.PBOManager") as mock_pbo_cls:
-            self.manager = ScreenManager(self.mock_window, capture_screenshots=True)
-            self.mock_pbo = mock_pbo_cls.return_value
-            # Default to 0 duration for setup
-            self.mock_pbo.last_capture_duration_us = 0.0
-
-    def test_metrics_exposure(self) -> None:
-        """Test that capture duration is tracked and exposed."""
-        # Set a fake duration on the mock
-        self.mock_pbo.last_capture_duration_us = 1234.5
-
-        self.assertEqual(self.manager.last_capture_duration_us, 1234.5)
-
-    def test_capture_overhead_budget(self) -> None:
-        """Test that the capture overhead is within budget (simulated)."""
-        # Ideally we would use a real PBOManager with mocked GL,
-        # but for unit testing we want to verify the PIPELINE logic.
-
-        # Simulate a capture that updates the duration
-        # We can't easily start/stop a real timer here via mocks without
-        # replacing the entire capture method, which defeats the purpose.
-        # So we trust the instrumentation logic (verified by code review)
-        # and verify here that IF the duration is high, we can detect it.
-
-        # Scenario: Fast capture
-        self.mock_pbo.last_capture_duration_us = 150.0  # 0.15ms
-        self.assertLess(
-            self.manager.last_capture_duration_us, 2000, "Capture should be under 2ms budget"
-        )
-
-        # Scenario: Slow capture (simulating failure)
-        # This is just to demonstrate the check works
-        self.mock_pbo.last_capture_duration_us = 5000.0  # 5ms
-        # self.assertLess(..., 2000) would fail here
-
-        # In a real integ test on hardware, accessing self.manager.last_capture_duration_us
-        # after a keypress would confirm if we pass the budget.
+
+@pytest.fixture
+def manager_and_pbo() -> Iterator[tuple[ScreenManager, MagicMock]]:
+    """A new ScreenManager with a mocked PBOManager and one registered screen."""
+    window = MagicMock()
+    window.width = 800
+    window.height = 600
+
+    # Patch PBOManager so no GL context is needed; ScreenManager only reads its metric
+    with patch("chaser_game.screen_manager.PBOManager") as mock_pbo_cls:
+        manager = ScreenManager(window, capture_screenshots=False)
+    mock_pbo = mock_pbo_cls.return_value
+    mock_pbo.last_capture_duration_us = 0.0
+    manager.register_screen(ScreenName.GAME_RUNNING, MagicMock(spec=dir(ScreenProtocol)))
+    yield manager, mock_pbo
+
+    manager.executor.shutdown()
+    manager._cleanup_shared_memory()
+
+
+def test_metrics_exposure(manager_and_pbo: tuple[ScreenManager, MagicMock]) -> None:
+    """Test that capture duration is tracked and exposed."""
+    manager, mock_pbo = manager_and_pbo
+    # Set a fake duration on the mock
+    mock_pbo.last_capture_duration_us = 1234.5
+
+    assert manager.last_capture_duration_us == 1234.5
+
+
+def _median_us(func: Callable[[], object], samples: int) -> float:
+    """Median wall time of func() in microseconds, with the GC paused while sampling."""
+    durations_us = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            func()
+            durations_us.append((time.perf_counter_ns() - start) / 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return statistics.median(durations_us)
+
+
+@pytest.mark.perf
+def test_capture_overhead_budget() -> None:
+    """Test that a PBO capture round-trip stays within the 2ms budget.
+
+    GL calls are mocked, so this measures the Python side of the pipeline:
+    buffer cycling, the mapped-buffer copy and the duration bookkeeping.
+    """
+    with patch.object(PBOManager, "_init_buffers"):
+        pbo = PBOManager(800, 600)
+    pbo.buffers = [1, 2]
+    pixels = ctypes.create_string_buffer(pbo.buffer_size)
+
+    with (
+        patch("chaser_game.utils.pbo.glBindBuffer"),
+        patch("chaser_game.utils.pbo.glReadPixels"),
+        patch("chaser_game.utils.pbo.glMapBuffer", return_value=ctypes.addressof(pixels)),
+        patch("chaser_game.utils.pbo.glUnmapBuffer"),
+    ):
+
+        def capture() -> bytes | None:
+            pbo.start_capture()
+            return pbo.end_capture()
+
+        for _ in range(CAPTURE_WARMUP):
+            capture()
+        median_us = _median_us(capture, CAPTURE_SAMPLES)
+        data = capture()
+
+    assert len(data or b"") == pbo.buffer_size
+    assert pbo.last_capture_duration_us > 0.0
+    assert median_us < CAPTURE_BUDGET_US, "Capture should be under 2ms budget"
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("capture_screenshots", [False, True], ids=["capture_off", "capture_idle"])
+def test_draw_overhead_budget(
+    manager_and_pbo: tuple[ScreenManager, MagicMock], capture_screenshots: bool
+) -> None:
+    """Test that a frame with no screenshot queued adds little on top of the screen draw.
+
+    Covers both capture disabled and capture enabled with nothing pending, the two paths
+    every ordinary frame takes.
+    """
+    manager, mock_pbo = manager_and_pbo
+    # Enter with capture off so no enter screenshot is queued, then apply the case
+    manager.set_active_screen(ScreenName.GAME_RUNNING)
+    manager.capture_screenshots = capture_screenshots
+
+    for _ in range(CAPTURE_WARMUP):
+        manager.on_draw()
+    median_us = _median_us(manager.on_draw, CAPTURE_SAMPLES)
+
+    mock_pbo.start_capture.assert_not_called()
+    assert median_us < DRAW_BUDGET_US, "Uncaptured frame should stay under the draw budget"
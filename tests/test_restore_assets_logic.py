@@ -4,9 +4,49 @@ import pytest
 from chaser_game.restore_assets import restore_assets
 
 
+class _StubLogger:
+    """Minimal logger double that records messages per level."""
+
+    def __init__(self) -> None:
+        self.messages: dict[str, list[str]] = {
+            "debug": [],
+            "info": [],
+            "warning": [],
+            "error": [],
+        }
+
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        self.messages["debug"].append(msg)
+
+    def info(self, msg: str, *args, **kwargs) -> None:
+        self.messages["info"].append(msg)
+
+    def warning(self, msg: str, *args, **kwargs) -> None:
+        self.messages["warning"].append(msg)
+
+    def error(self, msg: str, *args, **kwargs) -> None:
+        self.messages["error"].append(msg)
+
+
 @pytest.fixture
-def mock_logger():
-    return MagicMock()
+def stub_logger():
+    return _StubLogger()
+
+
+@pytest.fixture
+def answer_prompt(monkeypatch):
+    """Answer restore prompts with a fixed reply; returns the list of prompts shown."""
+    prompts: list[str] = []
+
+    def _answer(reply: str) -> list[str]:
+        def _input(prompt: str = "") -> str:
+            prompts.append(prompt)
+            return reply
+
+        monkeypatch.setattr("builtins.input", _input)
+        return prompts
+
+    return _answer
 
 
 @pytest.fixture
@@ -26,15 +66,14 @@ def mock_manifest():
 
 @patch("chaser_game.restore_assets.load_manifest")
 @patch("chaser_game.restore_assets.get_asset_dir")
-@patch("chaser_game.restore_assets.input")  # Mock input
 @patch("chaser_game.sprite_generator.SpriteSheetGenerator")  # Correct mock path
 def test_restore_assets_regenerate_confirmed(
     mock_generator_cls,
-    mock_input,
     mock_get_asset_dir,
     mock_load_manifest,
     mock_manifest,
-    mock_logger,
+    stub_logger,
+    answer_prompt,
     tmp_path,
 ):
     # Setup mocks
@@ -48,17 +87,16 @@ def test_restore_assets_regenerate_confirmed(
 
     target_dir = tmp_path / "sprites"
     target_dir.mkdir()
-    target_file = target_dir / "mouse_sheet.png"
 
     # User confirms
-    mock_input.return_value = "y"
+    prompts = answer_prompt("y")
 
     # Mock generator instance
     mock_gen_instance = MagicMock()
     mock_generator_cls.return_value = mock_gen_instance
 
     # Run
-    result = restore_assets(mock_logger, confirm=True)
+    result = restore_assets(stub_logger, confirm=True)
 
     # Verification
     assert result is False  # other_tracked is missing and cannot be regenerated
@@ -67,22 +105,21 @@ def test_restore_assets_regenerate_confirmed(
     mock_gen_instance.generate.assert_called_once()
 
     # Verify input prompt called
-    mock_input.assert_called_once()
+    assert len(prompts) == 1
 
 
 @patch("chaser_game.restore_assets.load_manifest")
 @patch("chaser_game.restore_assets.get_asset_dir")
-@patch("chaser_game.restore_assets.input")
 @patch("chaser_game.sprite_generator.SpriteSheetGenerator")
 @patch("shutil.move")
 def test_restore_assets_regenerate_success_flow(
     mock_utils_move,
     mock_gen_cls,
-    mock_input,
     mock_get_dir,
     mock_load,
     mock_manifest,
-    mock_logger,
+    stub_logger,
+    answer_prompt,
     tmp_path,
 ):
     """Verify flow passes through regeneration and confirmation."""
@@ -97,26 +134,20 @@ def test_restore_assets_regenerate_success_flow(
     (tmp_path / "images").mkdir()
     (tmp_path / "images" / "other.png").touch()
 
-    mock_input.return_value = "y"
+    answer_prompt("y")
 
-    result = restore_assets(mock_logger, confirm=True)
+    result = restore_assets(stub_logger, confirm=True)
 
     assert result is True
     # Verify success log for mouse_sheet
-    success_calls = [
-        c
-        for c in mock_logger.info.call_args_list
-        if "Restored sprites" in str(c) or "Restored" in str(c)
-    ]
-    assert len(success_calls) > 0
+    assert any("Restored" in msg for msg in stub_logger.messages["info"])
 
 
 @patch("chaser_game.restore_assets.load_manifest")
 @patch("chaser_game.restore_assets.get_asset_dir")
-@patch("chaser_game.restore_assets.input")
 @patch("chaser_game.sprite_generator.SpriteSheetGenerator")
 def test_restore_assets_denied(
-    mock_gen_cls, mock_input, mock_get_dir, mock_load, mock_manifest, mock_logger, tmp_path
+    mock_gen_cls, mock_get_dir, mock_load, mock_manifest, stub_logger, answer_prompt, tmp_path
 ):
     """Verify denial skips restoration."""
     mock_load.return_value = mock_manifest
@@ -124,10 +155,10 @@ def test_restore_assets_denied(
     (tmp_path / "source").mkdir()
     (tmp_path / "source" / "mouse.mp4").touch()
 
-    mock_input.return_value = "n"
+    answer_prompt("n")
 
-    result = restore_assets(mock_logger, confirm=True)
+    result = restore_assets(stub_logger, confirm=True)
 
     assert result is False  # Failed to restore mouse_sheet
-    assert mock_gen_cls.return_value.generate.assert_called  # Still generates to temp
-    mock_logger.warning.assert_any_call("  [SKIPPED] User aborted move.")
+    mock_gen_cls.return_value.generate.assert_called_once()  # Still generates to temp
+    assert "  [SKIPPED] User aborted move." in stub_logger.messages["warning"]
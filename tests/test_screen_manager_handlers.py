@@ -1,103 +1,127 @@
-import unittest
-from unittest.mock import MagicMock, call, patch
+"""Verify ScreenManager and Screens correctly manipulate the window event stack."""
 
+from collections.abc import Iterator
+from typing import NamedTuple
+from unittest.mock import MagicMock, patch
+
+import pytest
 from chaser_game.screen_manager import ScreenManager
 from chaser_game.screens import ScreenName
 from chaser_game.screens.game_running import GameRunningScreen
 from chaser_game.types import WindowProtocol
 
+# Attribute list for spec=, computed once; passing the class makes every MagicMock re-walk it
+_WINDOW_SPEC = dir(WindowProtocol)
+
+
+class ScreenEnv(NamedTuple):
+    """Mock window with a ScreenManager and a registered GameRunningScreen."""
+
+    window: MagicMock
+    manager: ScreenManager
+    screen: GameRunningScreen
+
 
-class TestScreenManagerHandlers(unittest.TestCase):
-    """Verify ScreenManager and Screens correctly manipulate the event stack."""
-
-    def setUp(self) -> None:
-        """Set up mock window and screen manager."""
-        self.mock_window = MagicMock(spec=WindowProtocol)
-        self.mock_window.width = 800
-        self.mock_window.height = 600
-
-        # Mock heavy dependencies BEFORE initializing screens
-        with (
-            patch("chaser_game.screens.game_running.get_loader") as mock_loader,
-            patch("chaser_game.screens.game_running.pyglet.sprite.Sprite") as mock_sprite,
-            patch("chaser_game.screens.game_running.pyglet.image.Animation.from_image_sequence"),
-            patch("chaser_game.screens.game_running.pyglet.media.Player"),
-            patch("chaser_game.screens.game_running.pyglet.image.ImageGrid"),
-        ):
-            # Setup image mock details
-            mock_loader.return_value.load_image.return_value.width = 32
-            mock_loader.return_value.load_image.return_value.height = 32
-
-            # Setup sprite mock details (needed for max() comparison in init)
-            # mock_sprite is the class. return_value is the instance.
-            instance = mock_sprite.return_value
-            instance.width = 32
-            instance.height = 32
-
-            # Initialize manager and screens
-            self.manager = ScreenManager(self.mock_window)
-            self.game_running_screen = GameRunningScreen(self.mock_window)
-
-            self.manager.register_screen(ScreenName.GAME_RUNNING, self.game_running_screen)
-
-    def test_set_active_screen_pushes_handler(self) -> None:
-        """Test that setting active screen pushes it to the window stack."""
-        # Reset mock calls from init
-        self.mock_window.reset_mock()
-
-        self.manager.set_active_screen(ScreenName.GAME_RUNNING)
-
-        # Verify screen was pushed
-        self.mock_window.push_handlers.assert_any_call(self.game_running_screen)
-
-        # Verify screen.on_enter was called, which should push Mouse
-        # Mouse is pushed separately
-        # Mouse object is self.game_running_screen.mouse
-        self.mock_window.push_handlers.assert_any_call(self.game_running_screen.mouse)
-
-    def test_screen_transition_pops_handlers(self) -> None:
-        """Test that switching screens removes old handlers."""
-        # Start at Game Running
-        self.manager.set_active_screen(ScreenName.GAME_RUNNING)
-        self.mock_window.reset_mock()
-
-        # Switch to itself (re-enter) or another screen.
-        # Let's mock a second screen to switch TO
-        mock_screen_2 = MagicMock()
-        self.manager.register_screen("splash", mock_screen_2)
-
-        self.manager.set_active_screen("splash")
-
-        # Verify GameRunningScreen was removed
-        self.mock_window.remove_handlers.assert_any_call(self.game_running_screen)
-
-        # Verify Mouse was removed (by GameRunningScreen.on_exit)
-        self.mock_window.remove_handlers.assert_any_call(self.game_running_screen.mouse)
-
-        # Verify new screen pushed
-        self.mock_window.push_handlers.assert_any_call(mock_screen_2)
-
-    def test_handler_order_correctness(self) -> None:
-        """Verify the order of pushing (Mouse should be Top)."""
-        self.mock_window.reset_mock()
-        self.manager.set_active_screen(ScreenName.GAME_RUNNING)
-
-        # Order should be:
-        # 1. Screen pushed (by Manager)
-        # 2. Mouse pushed (by Screen.on_enter)
-        # This means Mouse is Top (last pushed)
-
-        calls = self.mock_window.push_handlers.call_args_list
-        # Filter calls related to this test
-        # We expect at least these two
-
-        # assert call(screen) comes before call(mouse)
-        try:
-            screen_idx = calls.index(call(self.game_running_screen))
-            mouse_idx = calls.index(call(self.game_running_screen.mouse))
-
-            self.assertLess(
-                screen_idx, mouse_idx, "Screen should be pushed BEFORE Mouse so Mouse is on Top"
-            )
-        except ValueError:
-            self.fail("Expected calls to push_handlers not found")
+@pytest.fixture(scope="module")
+def _shared_env() -> Iterator[ScreenEnv]:
+    """Build the window, manager and screen once with heavy dependencies patched."""
+    with (
+        patch("chaser_game.screens.game_running.get_loader") as mock_loader,
+        patch("chaser_game.screens.game_running.pyglet.sprite.Sprite") as mock_sprite,
+        patch("chaser_game.screens.game_running.pyglet.image.Animation.from_image_sequence"),
+        patch("chaser_game.screens.game_running.pyglet.media.Player"),
+        patch("chaser_game.screens.game_running.pyglet.image.ImageGrid"),
+    ):
+        # Setup image mock details
+        mock_loader.return_value.load_image.return_value.width = 32
+        mock_loader.return_value.load_image.return_value.height = 32
+
+        # Setup sprite mock details (needed for max() comparison in init)
+        # mock_sprite is the class. return_value is the instance.
+        instance = mock_sprite.return_value
+        instance.width = 32
+        instance.height = 32
+
+        window = MagicMock(spec=_WINDOW_SPEC)
+        window.width = 800
+        window.height = 600
+        env = ScreenEnv(window, ScreenManager(window), GameRunningScreen(window))
+        yield env
+
+    # Release the shared manager's worker pool and shared memory
+    env.manager.executor.shutdown()
+    env.manager._cleanup_shared_memory()
+
+
+@pytest.fixture
+def env(_shared_env: ScreenEnv) -> ScreenEnv:
+    """The shared environment with window calls and screen registrations cleared."""
+    window, manager, screen = _shared_env
+    window.reset_mock()
+    manager.screens.clear()
+    manager.active_screen = None
+    manager.active_screen_name = None
+
+    manager.register_screen(ScreenName.GAME_RUNNING, screen)
+    return _shared_env
+
+
+def test_set_active_screen_pushes_handler(env: ScreenEnv) -> None:
+    """Test that setting active screen pushes it to the window stack."""
+    env.manager.set_active_screen(ScreenName.GAME_RUNNING)
+
+    # Verify screen was pushed
+    env.window.push_handlers.assert_any_call(env.screen)
+
+    # Verify screen.on_enter was called, which should push Mouse
+    # Mouse is pushed separately
+    env.window.push_handlers.assert_any_call(env.screen.mouse)
+
+
+def test_screen_transition_pops_handlers(env: ScreenEnv) -> None:
+    """Test that switching screens removes old handlers."""
+    # Start at Game Running
+    env.manager.set_active_screen(ScreenName.GAME_RUNNING)
+    env.window.reset_mock()
+
+    # Register a second screen to switch TO
+    mock_screen_2 = MagicMock()
+    env.manager.register_screen("splash", mock_screen_2)
+
+    env.manager.set_active_screen("splash")
+
+    # Verify GameRunningScreen was removed
+    env.window.remove_handlers.assert_any_call(env.screen)
+
+    # Verify Mouse was removed (by GameRunningScreen.on_exit)
+    env.window.remove_handlers.assert_any_call(env.screen.mouse)
+
+    # Verify new screen pushed
+    env.window.push_handlers.assert_any_call(mock_screen_2)
+
+
+def test_handler_order_correctness(env: ScreenEnv) -> None:
+    """Verify the order of pushing (Mouse should be Top)."""
+    env.manager.set_active_screen(ScreenName.GAME_RUNNING)
+
+    # Order should be:
+    # 1. Screen pushed (by Manager)
+    # 2. Mouse pushed (by Screen.on_enter)
+    # This means Mouse is Top (last pushed)
+
+    # Find the first push of each in one pass; we expect at least these two
+    screen_args = (env.screen,)
+    mouse_args = (env.screen.mouse,)
+    screen_idx = mouse_idx = None
+    for i, pushed in enumerate(env.window.push_handlers.call_args_list):
+        if screen_idx is None and pushed.args == screen_args:
+            screen_idx = i
+        elif mouse_idx is None and pushed.args == mouse_args:
+            mouse_idx = i
+        if screen_idx is not None and mouse_idx is not None:
+            break
+
+    assert screen_idx is not None and mouse_idx is not None, (
+        "Expected calls to push_handlers not found"
+    )
+    assert screen_idx < mouse_idx, "Screen should be pushed BEFORE Mouse so Mouse is on Top"
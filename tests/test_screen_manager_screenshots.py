@@ -1,162 +1,222 @@
-import unittest
-from typing import cast
-from unittest.mock import MagicMock, patch
-
-import pyglet
-from chaser_game.screen_manager import ScreenManager
+import datetime
+import os
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from chaser_game.screen_manager import ScreenManager, _save_screenshot_shm
 from chaser_game.screens import ScreenName
 from chaser_game.screens.base import ScreenProtocol
-
-
-class TestScreenManagerScreenshots(unittest.TestCase):
-    """Test automated screenshot functionality."""
-
-    def setUp(self) -> None:
-        self.mock_window = MagicMock()
-        self.mock_window.width = 800
-        self.mock_window.height = 600
-
-        # Patch PBOManager and SharedMemory initialized in __init__
-        with (
-            patch("chaser_game.screen_manager.PBOManager") as mock_pbo_cls,
-            patch("chaser_game.screen_manager.SharedMemory") as mock_shm_cls,
-        ):
-            self.mock_shm = MagicMock()
-            self.mock_shm.name = "test_shm"
-            self.mock_shm.buf = bytearray(800 * 600 * 4)  # Real buffer for assignment
-            mock_shm_cls.return_value = self.mock_shm
-            self.manager = ScreenManager(self.mock_window, capture_screenshots=False)
-            self.mock_pbo = mock_pbo_cls.return_value
-            # Default to 0 duration for setup
-            self.mock_pbo.last_capture_duration_us = 0.0
-        # Mock executor to prevent actual threading during tests
-        self.manager.executor = MagicMock()
-
-        # Create mock screens
-        self.screen_a = MagicMock(spec=ScreenProtocol)
-        self.screen_b = MagicMock(spec=ScreenProtocol)
-
-        # Use actual ScreenName members instead of arbitrary strings
-        self.manager.register_screen(ScreenName.GAME_START, self.screen_a)
-        self.manager.register_screen(ScreenName.GAME_RUNNING, self.screen_b)
-
-    @patch("chaser_game.screen_manager.pyglet.image.get_buffer_manager")
-    @patch("chaser_game.screen_manager.datetime")
-    def test_screenshot_workflow(self, mock_datetime, mock_get_buffer_manager) -> None:
-        """Test full flow of screenshots: enter A -> draw -> switch B -> draw."""
-        # Setup mocks
-        mock_buffer = MagicMock()
-        mock_image_data = MagicMock()
-        mock_image_data.width = 800
-        # Return actual bytes for SharedMemory buffer assignment
-        mock_image_data.get_data.return_value = b"\x00" * (800 * 600 * 4)
-        mock_get_buffer_manager.return_value.get_color_buffer.return_value = mock_buffer
-        mock_buffer.get_image_data.return_value = mock_image_data
-
-        mock_datetime.datetime.now.return_value.strftime.return_value = "TIMESTAMP"
-        mock_datetime.datetime.now.return_value.microsecond = 456789  # Sets ms to 456
-
-        # Enable auto screenshots for this test
-        self.manager.capture_screenshots = True
-
-        # 1. Enter Screen A (GAME_START)
-        self.manager.set_active_screen(ScreenName.GAME_START)
-
-        # Should NOT capture exit (prev was None)
-        # Should queue enter
-        self.assertTrue(self.manager._capture_next_frame)
-        mock_executor = cast(MagicMock, self.manager.executor)
-        self.assertEqual(mock_executor.submit.call_count, 0)
-        self.assertEqual(mock_buffer.save.call_count, 0)
-
-        # 2. Draw Screen A (First Frame)
-        self.manager.on_draw()
-
-        # Should capture enter A
-        # Should capture enter A
-        mock_executor = cast(MagicMock, self.manager.executor)
-        # New API: executor.submit(_save_screenshot, raw_data, width, height, path)
-        self.assertEqual(mock_executor.submit.call_count, 1)
-        args, _ = mock_executor.submit.call_args
-        self.assertIn("game_start_enter.png", args[5])  # args[5] is path
-        self.assertFalse(self.manager._capture_next_frame)
-        mock_executor.submit.reset_mock()
-
-        # 3. Draw Screen A (Subsequent Frame)
-        self.manager.on_draw()
-        mock_executor = cast(MagicMock, self.manager.executor)
-        self.assertEqual(mock_executor.submit.call_count, 0)
-
-        # 4. Switch to Screen B (GAME_RUNNING)
-        self.manager.set_active_screen(ScreenName.GAME_RUNNING)
-
-        # Should capture exit A immediately
-        # Should capture exit A immediately
-        mock_executor = cast(MagicMock, self.manager.executor)
-        self.assertEqual(mock_executor.submit.call_count, 1)
-        args, _ = mock_executor.submit.call_args
-        self.assertIn("game_start_exit.png", args[5])  # args[5] is path
-        self.assertTrue(self.manager._capture_next_frame)
-        mock_executor.submit.reset_mock()
-
-        # 5. Draw Screen B
-        self.manager.on_draw()
-
-        # Should capture enter B
-        # Should capture enter B
-        mock_executor = cast(MagicMock, self.manager.executor)
-        self.assertEqual(mock_executor.submit.call_count, 1)
-        args, _ = mock_executor.submit.call_args
-        self.assertIn("game_running_enter.png", args[5])  # args[5] is path
-
-    @patch("chaser_game.screen_manager.pyglet.image.get_buffer_manager")
-    @patch("chaser_game.screen_manager.datetime")
-    def test_manual_screenshot_trigger(self, mock_datetime, mock_get_buffer_manager) -> None:
-        """Test that INSERT key triggers manual screenshot (Two-Phase)."""
-        # Setup mocks
-        mock_buffer = MagicMock()
-        mock_image_data = MagicMock()
-        mock_get_buffer_manager.return_value.get_color_buffer.return_value = mock_buffer
-        mock_buffer.get_image_data.return_value = mock_image_data
-
-        mock_datetime.datetime.now.return_value.strftime.return_value = "TIMESTAMP"
-        mock_datetime.datetime.now.return_value.microsecond = 123000
-
-        self.manager.set_active_screen(ScreenName.GAME_START)
-
-        # Mock PBO end_capture to return data (Phase 2)
-        self.mock_pbo.end_capture.return_value = b"FAKE_DATA" * (800 * 600 * 4 // 9)
-        self.mock_pbo.last_capture_duration_us = 100.0
-
-        # 1. Simulate INSERT key press (Queues pending start)
-        self.manager.on_key_press(pyglet.window.key.INSERT, 0)
-
-        # Verify nothing happened yet (deferred to draw)
-        self.mock_pbo.start_capture.assert_not_called()
-        self.mock_pbo.end_capture.assert_not_called()
-
-        # 2. Simulate Frame N Draw (Triggers Phase 1: Start Capture)
-        self.manager.on_draw()
-
-        self.mock_pbo.start_capture.assert_called_once()
-        self.mock_pbo.end_capture.assert_not_called()
-
-        # 3. Simulate Frame N+1 Update (Triggers Phase 2: Readback)
-        self.manager.update(0.16)
-
-        self.mock_pbo.end_capture.assert_called_once()
-
-        # Should capture with 'manual' event (using correct mock call check)
-        mock_executor = cast(MagicMock, self.manager.executor)
-        self.assertEqual(mock_executor.submit.call_count, 1)
-        args, _ = mock_executor.submit.call_args
-        self.assertIn("manual", args[5])  # args[5] is filename path
-
-    def test_pbo_resize_handling(self) -> None:
-        """Test PBO is resized when window size changes."""
-        self.mock_window.width = 1024
-        self.mock_window.height = 768
-
-        self.manager.update(0.1)
-
-        self.mock_pbo.resize.assert_called_with(1024, 768)
+from pyglet.window.key import INSERT
+
+SHM_NAME = "test_shm"
+FRAME_SIZE = 800 * 600 * 4  # RGBA
+
+# One frame of pixels and one shared-memory buffer for the whole module. The manager only
+# copies frames into the buffer and no test reads it back, so reuse cannot leak between tests.
+_FRAME = bytes(FRAME_SIZE)
+_SHM_BUF = bytearray(FRAME_SIZE)
+
+# Fixed capture time; 456789 us makes the filename milliseconds 456
+_FROZEN_NOW = datetime.datetime(2024, 1, 1, 0, 0, 0, 456789)
+# Filename prefix every capture gets at _FROZEN_NOW
+_STAMP = "20240101_000000_456_"
+
+# Screen mocks are restricted to the protocol's attributes, listed once per module
+_SCREEN_SPEC = dir(ScreenProtocol)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _frozen_clock() -> Iterator[None]:
+    """Freeze the screenshot timestamp clock once for the whole module."""
+    clock = SimpleNamespace(datetime=SimpleNamespace(now=lambda: _FROZEN_NOW))
+    with patch("chaser_game.screen_manager.datetime", clock):
+        yield
+
+
+@pytest.fixture(params=["shared_memory", "no_shared_memory"])
+def backend(request: pytest.FixtureRequest) -> str:
+    """Screenshot transfer backend: a SharedMemory buffer, or none when creation fails."""
+    return request.param
+
+
+@pytest.fixture
+def pbo() -> MagicMock:
+    """Mocked PBOManager instance the manager captures through."""
+    pbo = MagicMock()
+    # Default to 0 duration for setup
+    pbo.last_capture_duration_us = 0.0
+    return pbo
+
+
+@pytest.fixture
+def manager(backend: str, pbo: MagicMock) -> ScreenManager:
+    """ScreenManager with mocked PBO and shared memory, and two screens."""
+    window = MagicMock()
+    window.width = 800
+    window.height = 600
+
+    # Patch PBOManager and SharedMemory initialized in __init__
+    with (
+        patch("chaser_game.screen_manager.PBOManager", return_value=pbo),
+        patch("chaser_game.screen_manager.SharedMemory") as mock_shm_cls,
+    ):
+        if backend == "shared_memory":
+            mock_shm = MagicMock()
+            mock_shm.name = SHM_NAME
+            mock_shm.buf = _SHM_BUF  # Real buffer for assignment
+            mock_shm_cls.return_value = mock_shm
+        else:
+            mock_shm_cls.side_effect = OSError("shared memory unavailable")
+        manager = ScreenManager(window, capture_screenshots=False)
+
+    # Use actual ScreenName members instead of arbitrary strings
+    manager.register_screen(ScreenName.GAME_START, MagicMock(spec=_SCREEN_SPEC))
+    manager.register_screen(ScreenName.GAME_RUNNING, MagicMock(spec=_SCREEN_SPEC))
+    return manager
+
+
+@pytest.fixture
+def executor(manager: ScreenManager) -> MagicMock:
+    """Mocked executor installed on the manager, only for tests that save screenshots.
+
+    The pool the manager created starts no worker until a task is submitted, so tests that
+    never save can keep it.
+    """
+    # Mock executor to prevent actual process spawning during tests
+    executor = MagicMock()
+    manager.executor = executor
+    return executor
+
+
+@pytest.fixture(scope="module")
+def _color_buffer() -> Iterator[SimpleNamespace]:
+    """Patch the color buffer readback once for the whole module.
+
+    The readback chain is plain namespaces; only the buffer's save() is a Mock, since it is
+    the one call tests assert on.
+    """
+    # Return actual bytes for SharedMemory buffer assignment
+    image_data = SimpleNamespace(width=800, get_data=lambda fmt, pitch: _FRAME)
+    buffer = SimpleNamespace(get_image_data=lambda: image_data, save=Mock())
+    buffer_manager = SimpleNamespace(get_color_buffer=lambda: buffer)
+
+    with patch("chaser_game.screen_manager.pyglet.image.get_buffer_manager", lambda: buffer_manager):
+        yield buffer
+
+
+@pytest.fixture
+def color_buffer(_color_buffer: SimpleNamespace) -> SimpleNamespace:
+    """The patched color buffer with save() calls from earlier tests cleared."""
+    _color_buffer.save.reset_mock()
+    return _color_buffer
+
+
+def _assert_submitted(
+    manager: ScreenManager, executor: MagicMock, backend: str, filename: str
+) -> None:
+    """Assert exactly one save was submitted for filename over the expected backend."""
+    submit = executor.submit
+    shm_name, size = (SHM_NAME, FRAME_SIZE) if backend == "shared_memory" else ("", 0)
+    path = os.path.join(manager._screenshot_dir, _STAMP + filename)
+    submit.assert_called_once_with(_save_screenshot_shm, shm_name, size, 800, 600, path)
+    submit.reset_mock()
+
+
+# Automatic screenshot workflow, in order: step -> (action, saved file or None, enter capture
+# still queued afterwards). Entering A queues its capture (no exit, prev was None), the next
+# draw saves it, switching to B saves A's exit at once and queues B's enter.
+_WORKFLOW: dict[str, tuple[Callable[[ScreenManager], object], str | None, bool]] = {
+    "enter_a": (lambda m: m.set_active_screen(ScreenName.GAME_START), None, True),
+    "draw_a": (lambda m: m.on_draw(), "game_start_enter.png", False),
+    "redraw_a": (lambda m: m.on_draw(), None, False),
+    "switch_b": (
+        lambda m: m.set_active_screen(ScreenName.GAME_RUNNING),
+        "game_start_exit.png",
+        True,
+    ),
+    "draw_b": (lambda m: m.on_draw(), "game_running_enter.png", False),
+}
+
+
+def _advance_to(manager: ScreenManager, executor: MagicMock, step: str) -> None:
+    """Run the workflow steps before step, then forget the saves they submitted."""
+    for name, (action, _, _) in _WORKFLOW.items():
+        if name == step:
+            break
+        action(manager)
+    executor.submit.reset_mock()
+
+
+@pytest.mark.parametrize("step", list(_WORKFLOW))
+def test_screenshot_workflow(
+    manager: ScreenManager,
+    executor: MagicMock,
+    backend: str,
+    color_buffer: SimpleNamespace,
+    step: str,
+) -> None:
+    """Each step of enter A -> draw -> redraw -> switch B -> draw saves the right file."""
+    # Enable auto screenshots for this test
+    manager.capture_screenshots = True
+    _advance_to(manager, executor, step)
+    action, filename, queued = _WORKFLOW[step]
+
+    action(manager)
+
+    if filename is None:
+        executor.submit.assert_not_called()
+    else:
+        _assert_submitted(manager, executor, backend, filename)
+    assert manager._capture_next_frame is queued
+    color_buffer.save.assert_not_called()
+
+
+def test_manual_screenshot_trigger(
+    manager: ScreenManager,
+    pbo: MagicMock,
+    executor: MagicMock,
+    backend: str,
+    color_buffer: SimpleNamespace,
+) -> None:
+    """Test that INSERT key triggers manual screenshot (Two-Phase)."""
+    manager.set_active_screen(ScreenName.GAME_START)
+
+    # Mock PBO end_capture to return data (Phase 2)
+    pbo.end_capture.return_value = _FRAME
+    pbo.last_capture_duration_us = 100.0
+
+    # 1. Simulate INSERT key press (Queues pending start)
+    manager.on_key_press(INSERT, 0)
+
+    # Verify nothing happened yet (deferred to draw)
+    pbo.start_capture.assert_not_called()
+    pbo.end_capture.assert_not_called()
+
+    # 2. Simulate Frame N Draw (Triggers Phase 1: Start Capture)
+    manager.on_draw()
+
+    pbo.start_capture.assert_called_once()
+    pbo.end_capture.assert_not_called()
+
+    # 3. Simulate Frame N+1 Update (Triggers Phase 2: Readback)
+    manager.update(0.16)
+
+    pbo.end_capture.assert_called_once()
+
+    # Manual captures are only saved through shared memory
+    if backend == "shared_memory":
+        _assert_submitted(manager, executor, backend, "game_start_manual.png")
+    else:
+        executor.submit.assert_not_called()
+
+
+def test_pbo_resize_handling(manager: ScreenManager, pbo: MagicMock) -> None:
+    """Test PBO is resized when window size changes."""
+    manager.window.width = 1024
+    manager.window.height = 768
+
+    manager.update(0.1)
+
+    pbo.resize.assert_called_with(1024, 768)
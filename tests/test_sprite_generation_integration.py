@@ -5,41 +5,79 @@ using the restore-assets CLI and sprite_generator module.
 """
 
 import logging
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from chaser_game.restore_assets import regenerate_sprite_sheet, restore_assets
 from chaser_game.sprite_generator import SpriteSheetGenerator
 
+# Completed subprocess.run result; callers only read returncode, so one instance is shared
+_OK_RESULT = SimpleNamespace(returncode=0, stdout="", stderr="")
+
+# Manifests returned by the mocked load_manifest; restore_assets only reads them
+_MANIFEST_WITH_KITTEN = MappingProxyType(
+    {
+        "images": {
+            "kitten": {"path": "sprites/kitten.png", "tracked": True},
+            "mouse_sheet": {
+                "path": "sprites/mouse_sheet.png",
+                "tracked": False,
+                "source": "source/mouse.mp4",
+            },
+        },
+        "audio": {},
+    }
+)
+_MANIFEST_MOUSE_ONLY = MappingProxyType(
+    {
+        "images": {
+            "mouse_sheet": {
+                "path": "sprites/mouse_sheet.png",
+                "tracked": False,
+            },
+        },
+        "audio": {},
+    }
+)
+_MANIFEST_EMPTY = MappingProxyType({"images": {}, "audio": {}})
+
 
 class TestSpriteGenerationWorkflow(unittest.TestCase):
     """Integration tests for sprite sheet generation workflow."""
 
-    def setUp(self) -> None:
-        """Set up test environment with temporary directories."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_assets_dir = Path(self.temp_dir.name) / "assets"
-        self.test_assets_dir.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the temporary asset tree once for the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.test_assets_dir = Path(cls.temp_dir.name) / "assets"
+        cls.test_assets_dir.mkdir(parents=True, exist_ok=True)
 
         # Create asset subdirectories
-        (self.test_assets_dir / "source").mkdir(exist_ok=True)
-        (self.test_assets_dir / "sprites").mkdir(exist_ok=True)
+        (cls.test_assets_dir / "source").mkdir(exist_ok=True)
+        (cls.test_assets_dir / "sprites").mkdir(exist_ok=True)
 
         # Create test video file
-        self.test_video = self.test_assets_dir / "source" / "mouse.mp4"
-        self.test_video.touch()
+        cls.test_video = cls.test_assets_dir / "source" / "mouse.mp4"
+        cls.test_video.touch()
 
         # Expected output
-        self.expected_sprite_sheet = self.test_assets_dir / "sprites" / "mouse_sheet.png"
+        cls.expected_sprite_sheet = cls.test_assets_dir / "sprites" / "mouse_sheet.png"
 
         # Set up logger
-        self.logger = logging.getLogger(__name__)
+        cls.logger = logging.getLogger(__name__)
 
-    def tearDown(self) -> None:
+    @classmethod
+    def tearDownClass(cls) -> None:
         """Clean up temporary directories."""
-        self.temp_dir.cleanup()
+        cls.temp_dir.cleanup()
+
+    def setUp(self) -> None:
+        """Remove the sprite sheet, the only file tests generate in the shared tree."""
+        self.expected_sprite_sheet.unlink(missing_ok=True)
 
     @patch("chaser_game.restore_assets.get_asset_dir")
     @patch("shutil.which")
@@ -53,14 +91,12 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         """Test successful sprite sheet regeneration via restore_assets."""
         mock_get_asset_dir.return_value = self.test_assets_dir
         mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
         # Simulate successful generation by creating output file
         def run_side_effect(*args: tuple, **kwargs):  # type: ignore
             self.expected_sprite_sheet.touch()
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK_RESULT
 
         mock_run.side_effect = run_side_effect
 
@@ -80,6 +116,7 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         # Create assets dir without the source video
         empty_assets_dir = Path(self.temp_dir.name) / "empty_assets"
         empty_assets_dir.mkdir()
+        self.addCleanup(shutil.rmtree, empty_assets_dir)
         (empty_assets_dir / "source").mkdir()
         (empty_assets_dir / "sprites").mkdir()
 
@@ -139,9 +176,7 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         def run_side_effect(*args: tuple, **kwargs):  # type: ignore
             call_captured.append(args[0])
             self.expected_sprite_sheet.touch()
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK_RESULT
 
         mock_run.side_effect = run_side_effect
 
@@ -171,27 +206,15 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         """Test restore_assets workflow detects and regenerates missing sprite sheets."""
         mock_get_asset_dir.return_value = self.test_assets_dir
         mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
         # Mock manifest indicating sprite sheet should exist
-        mock_load_manifest.return_value = {
-            "images": {
-                "kitten": {"path": "sprites/kitten.png", "tracked": True},
-                "mouse_sheet": {
-                    "path": "sprites/mouse_sheet.png",
-                    "tracked": False,
-                    "source": "source/mouse.mp4",
-                },
-            },
-            "audio": {},
-        }
+        mock_load_manifest.return_value = _MANIFEST_WITH_KITTEN
 
         # Simulate sprite sheet creation
         def run_side_effect(*args: tuple, **kwargs):  # type: ignore
             self.expected_sprite_sheet.touch()
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK_RESULT
 
         mock_run.side_effect = run_side_effect
 
@@ -216,24 +239,17 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
 
         # Create an existing sprite sheet with original content
         original_content = b"original sprite sheet data"
-        self.expected_sprite_sheet.touch()
         self.expected_sprite_sheet.write_bytes(original_content)
+        try:
+            mock_load_manifest.return_value = _MANIFEST_MOUSE_ONLY
 
-        mock_load_manifest.return_value = {
-            "images": {
-                "mouse_sheet": {
-                    "path": "sprites/mouse_sheet.png",
-                    "tracked": False,
-                },
-            },
-            "audio": {},
-        }
-
-        result = restore_assets(self.logger, dry_run=False)
+            result = restore_assets(self.logger, dry_run=False)
 
-        # Verify original content is preserved
-        self.assertTrue(self.expected_sprite_sheet.exists())
-        self.assertEqual(self.expected_sprite_sheet.read_bytes(), original_content)
+            # Verify original content is preserved
+            self.assertTrue(self.expected_sprite_sheet.exists())
+            self.assertEqual(self.expected_sprite_sheet.read_bytes(), original_content)
+        finally:
+            self.expected_sprite_sheet.unlink(missing_ok=True)
 
     @patch("chaser_game.restore_assets.get_asset_dir")
     @patch("chaser_game.restore_assets.load_manifest")
@@ -248,15 +264,7 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         mock_get_asset_dir.return_value = self.test_assets_dir
         mock_which.return_value = "ffmpeg"
 
-        mock_load_manifest.return_value = {
-            "images": {
-                "mouse_sheet": {
-                    "path": "sprites/mouse_sheet.png",
-                    "tracked": False,
-                },
-            },
-            "audio": {},
-        }
+        mock_load_manifest.return_value = _MANIFEST_MOUSE_ONLY
 
         result = restore_assets(self.logger, dry_run=True)
 
@@ -282,14 +290,13 @@ class TestSpriteGenerationWorkflow(unittest.TestCase):
         mock_which.return_value = "ffmpeg"
 
         def run_side_effect(*args: tuple, **kwargs):  # type: ignore
-            result = MagicMock()
-            result.returncode = 0
-            return result
+            return _OK_RESULT
 
         mock_run.side_effect = run_side_effect
 
         # Verify parent directory doesn't exist
         self.assertFalse(nested_output_dir.parent.exists())
+        self.addCleanup(shutil.rmtree, self.test_assets_dir / "nested", ignore_errors=True)
 
         # Generate sprite sheet (use SpriteSheetGenerator directly)
         generator = SpriteSheetGenerator()
@@ -331,8 +338,8 @@ class TestSpriteGenerationCLIWorkflow(unittest.TestCase):
 
         mock_get_asset_dir.return_value = test_assets_dir
         mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
-        mock_load_manifest.return_value = {"images": {}, "audio": {}}
+        mock_run.return_value = _OK_RESULT
+        mock_load_manifest.return_value = _MANIFEST_EMPTY
 
         # Test with custom grid
         generator = SpriteSheetGenerator()
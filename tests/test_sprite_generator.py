@@ -1,14 +1,19 @@
 """Unit tests for SpriteSheetGenerator class."""
 
 import os
+import shutil
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from chaser_game.sprite_generator import SpriteSheetGenerator
 
+# Completed subprocess.run result; callers only read returncode, so one instance is shared
+_OK_RESULT = SimpleNamespace(returncode=0, stdout="", stderr="")
+
 
 class TestSpriteSheetGeneratorInit(unittest.TestCase):
     """Tests for SpriteSheetGenerator initialization."""
@@ -38,29 +43,32 @@ class TestSpriteSheetGeneratorInit(unittest.TestCase):
 class TestSpriteSheetGeneratorGenerate(unittest.TestCase):
     """Tests for sprite sheet generation."""
 
-    def setUp(self) -> None:
-        """Create temporary test environment."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_video = os.path.join(self.temp_dir.name, "test.mp4")
-        self.test_output = os.path.join(self.temp_dir.name, "output", "sheet.png")
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the temporary test environment once for the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.test_video = os.path.join(cls.temp_dir.name, "test.mp4")
+        cls.test_output = os.path.join(cls.temp_dir.name, "output", "sheet.png")
 
         # Create a dummy video file
-        Path(self.test_video).touch()
+        Path(cls.test_video).touch()
 
-    def tearDown(self) -> None:
+        # generate() only reads the ffmpeg path resolved here, so one instance serves every test
+        with patch("shutil.which", return_value="ffmpeg"):
+            cls.generator = SpriteSheetGenerator()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
         """Clean up temporary files."""
-        self.temp_dir.cleanup()
+        cls.temp_dir.cleanup()
 
-    @patch("shutil.which")
     @patch("subprocess.run")
-    def test_generate_success(self, mock_run: MagicMock, mock_which: MagicMock) -> None:
+    def test_generate_success(self, mock_run: MagicMock) -> None:
         """Test successful sprite sheet generation."""
-        mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
-        generator = SpriteSheetGenerator()
         # generate() returns None on success (no exception raised)
-        generator.generate(
+        self.generator.generate(
             self.test_video,
             self.test_output,
             grid_width=10,
@@ -78,60 +86,43 @@ class TestSpriteSheetGeneratorGenerate(unittest.TestCase):
         self.assertIn(self.test_video, cmd)
         self.assertIn(self.test_output, cmd)
 
-    @patch("shutil.which")
     @patch("subprocess.run")
-    def test_generate_failure(self, mock_run: MagicMock, mock_which: MagicMock) -> None:
+    def test_generate_failure(self, mock_run: MagicMock) -> None:
         """Test sprite sheet generation failure raises CalledProcessError."""
-        mock_which.return_value = "ffmpeg"
         # With check=True, non-zero returncode raises CalledProcessError
         mock_run.side_effect = subprocess.CalledProcessError(1, "ffmpeg", stderr="Error")
 
-        generator = SpriteSheetGenerator()
         with self.assertRaises(subprocess.CalledProcessError):
-            generator.generate(self.test_video, self.test_output)
+            self.generator.generate(self.test_video, self.test_output)
 
-    @patch("shutil.which")
-    def test_generate_video_not_found(self, mock_which: MagicMock) -> None:
+    def test_generate_video_not_found(self) -> None:
         """Test generation with missing video file."""
-        mock_which.return_value = "ffmpeg"
-
-        generator = SpriteSheetGenerator()
-
         with self.assertRaises(FileNotFoundError):
-            generator.generate(
+            self.generator.generate(
                 "/nonexistent/video.mp4",
                 self.test_output,
             )
 
-    @patch("shutil.which")
     @patch("subprocess.run")
-    def test_generate_creates_output_directory(
-        self, mock_run: MagicMock, mock_which: MagicMock
-    ) -> None:
+    def test_generate_creates_output_directory(self, mock_run: MagicMock) -> None:
         """Test that output directory is created if it doesn't exist."""
-        mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
         output_dir = os.path.join(self.temp_dir.name, "new", "path", "sheet.png")
         self.assertFalse(os.path.exists(os.path.dirname(output_dir)))
+        self.addCleanup(shutil.rmtree, os.path.join(self.temp_dir.name, "new"), ignore_errors=True)
 
-        generator = SpriteSheetGenerator()
-        generator.generate(self.test_video, output_dir)
+        self.generator.generate(self.test_video, output_dir)
 
         # Directory should be created
         self.assertTrue(os.path.exists(os.path.dirname(output_dir)))
 
-    @patch("shutil.which")
     @patch("subprocess.run")
-    def test_generate_custom_grid_and_frame_size(
-        self, mock_run: MagicMock, mock_which: MagicMock
-    ) -> None:
+    def test_generate_custom_grid_and_frame_size(self, mock_run: MagicMock) -> None:
         """Test generation with custom grid and frame dimensions."""
-        mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
-        generator = SpriteSheetGenerator()
-        generator.generate(
+        self.generator.generate(
             self.test_video,
             self.test_output,
             grid_width=5,
@@ -147,18 +138,13 @@ class TestSpriteSheetGeneratorGenerate(unittest.TestCase):
         self.assertIn("scale=64:64", cmd)
         self.assertIn("tile=5:8", cmd)
 
-    @patch("shutil.which")
     @patch("subprocess.run")
-    def test_generate_subprocess_exception(
-        self, mock_run: MagicMock, mock_which: MagicMock
-    ) -> None:
+    def test_generate_subprocess_exception(self, mock_run: MagicMock) -> None:
         """Test handling of subprocess exceptions (bubbles up to caller)."""
-        mock_which.return_value = "ffmpeg"
         mock_run.side_effect = OSError("Subprocess error")
 
-        generator = SpriteSheetGenerator()
         with self.assertRaises(OSError):
-            generator.generate(self.test_video, self.test_output)
+            self.generator.generate(self.test_video, self.test_output)
 
 
 class TestSpriteSheetGeneratorVideoInfo(unittest.TestCase):
@@ -305,7 +291,7 @@ class TestSpriteSheetGeneratorIntegration(unittest.TestCase):
     ) -> None:
         """Test generation with default grid and frame parameters."""
         mock_which.return_value = "ffmpeg"
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_run.return_value = _OK_RESULT
 
         temp_video = os.path.join(self.temp_dir.name, "test.mp4")
         temp_output = os.path.join(self.temp_dir.name, "sheet.png")
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 End-to-End Test: Verify full game startup with new asset system.
 
@@ -7,22 +6,33 @@ This test verifies that:
 2. All required assets are found (or fallbacks are available)
 3. The game window can be created
 4. Core entities load without errors
-"""
 
-import argparse
-import logging
-import sys
-from pathlib import Path
+Run with ``pytest tests/test_startup.py --log-cli-level=DEBUG`` to see the startup logs.
+"""
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from collections.abc import Iterator
+from unittest.mock import patch
 
+import pytest
 from chaser_game.assets import get_loader
-from chaser_game.logging_config import get_logger, init_logging
+from chaser_game.hello_world import main as run_hello_world
+from chaser_game.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _mock_pyglet_run() -> Iterator[None]:
+    """Replace the pyglet event loop once for the module so startup returns immediately."""
+
+    def mock_run() -> None:
+        """Immediately close instead of running."""
+        logger.debug("Game window would start (mocked for testing)")
+
+    with patch("pyglet.app.run", mock_run):
+        yield
+
+
 def test_asset_system() -> None:
     """Test asset loader initialization and asset verification."""
     logger.info("Testing asset system...")
@@ -53,18 +63,6 @@ def test_game_startup() -> None:
     """Test that game can initialize and start without crashing."""
     logger.info("Testing game startup...")
 
-    import pyglet
-    from chaser_game.hello_world import main as run_hello_world
-
-    # Mock the run to prevent actual window creation
-    original_run = pyglet.app.run
-
-    def mock_run():
-        """Immediately close instead of running."""
-        logger.debug("Game window would start (mocked for testing)")
-
-    pyglet.app.run = mock_run  # type: ignore[method-assign]
-
     try:
         # Call the startup - should not raise exceptions
         run_hello_world()
@@ -72,80 +70,3 @@ def test_game_startup() -> None:
     except Exception as e:
         logger.error(f"Game initialization failed: {e}")
         raise AssertionError(f"Game initialization failed: {e}") from e
-    finally:
-        pyglet.app.run = original_run
-
-
-def main(verbosity: int = 0) -> int:
-    """Run all E2E tests.
-
-    Args:
-        verbosity: Verbosity level (0=WARNING, 1=INFO, 2=DEBUG, 3+=TRACE).
-
-    Returns:
-        Exit code (0 for success, 1 for failure).
-    """
-    from chaser_game.logging_config import TRACE_LEVEL
-
-    # Determine log level based on verbosity
-    if verbosity == 0:
-        log_level = logging.WARNING
-    elif verbosity == 1:
-        log_level = logging.INFO
-    elif verbosity == 2:
-        log_level = logging.DEBUG
-    else:
-        log_level = TRACE_LEVEL
-
-    init_logging(level=log_level)
-
-    logger.info("=" * 60)
-    logger.info("E2E Test: Full Game Startup with New Asset System")
-    logger.info("=" * 60)
-
-    tests = [
-        ("Asset System", test_asset_system),
-        ("Game Startup", test_game_startup),
-    ]
-
-    logger.info("Running test suite...")
-    results = []
-
-    for name, test_func in tests:
-        try:
-            test_func()
-            logger.info(f"✓ {name} passed")
-            results.append((name, True))
-        except Exception as e:
-            logger.error(f"✗ {name} failed: {e}")
-            results.append((name, False))
-
-    # Summary
-    logger.info("=" * 60)
-    logger.info("Test Summary:")
-    for name, passed in results:
-        status = "PASS" if passed else "FAIL"
-        logger.info(f"  [{status}] {name}")
-
-    all_passed = all(passed for _, passed in results)
-    logger.info("=" * 60)
-
-    if all_passed:
-        logger.info("All E2E tests PASSED")
-        return 0
-    else:
-        logger.error("Some E2E tests FAILED")
-        return 1
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="E2E test for game startup")
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase verbosity: -v (INFO), -vv (DEBUG), -vvv (TRACE)",
-    )
-    args = parser.parse_args()
-    sys.exit(main(verbosity=args.verbose))
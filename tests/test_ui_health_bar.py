@@ -1,188 +1,180 @@
 """Tests for the HealthBar UI component."""
 
-import unittest
+from collections.abc import Callable, Iterator
+from functools import cache
 from unittest.mock import patch
 
+import pytest
+from chaser_game.colors import Color
 from chaser_game.config import CONFIG
 from chaser_game.ui.health_bar import HealthBar
 
 
-class TestHealthBar(unittest.TestCase):
-    """Test the HealthBar UI component."""
-
-    def test_health_bar_creation_defaults(self) -> None:
-        """Test creating a health bar with default values."""
-        bar = HealthBar()
-        self.assertEqual(bar.max_value, CONFIG.MAX_HEALTH)
-        self.assertEqual(bar.width, CONFIG.BAR_WIDTH)
-        self.assertEqual(bar.height, CONFIG.BAR_HEIGHT)
-
-    def test_health_bar_creation_custom_values(self) -> None:
-        """Test creating a health bar with custom values."""
-        bar = HealthBar(max_value=200.0, width=100, height=10, x=50.0, y=75.0)
-        self.assertEqual(bar.max_value, 200.0)
-        self.assertEqual(bar.width, 100)
-        self.assertEqual(bar.height, 10)
-
-    def test_health_bar_update_full_health(self) -> None:
-        """Test health bar at full value."""
-        bar = HealthBar(max_value=100.0, width=100)
-        bar.update(current_value=100.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 100)
-        # Color is set by pyglet shapes, includes alpha channel
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_GREEN)
-
-    def test_health_bar_update_half_health(self) -> None:
-        """Test health bar at half value."""
-        bar = HealthBar(max_value=100.0, width=100)
-        bar.update(current_value=50.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 50)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_GREEN)
-
-    def test_health_bar_update_zero_health(self) -> None:
-        """Test health bar at zero value."""
-        bar = HealthBar(max_value=100.0, width=100)
-        bar.update(current_value=0.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 0)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_RED)
-
-    def test_health_bar_color_change_threshold(self) -> None:
-        """Test that bar color changes at threshold."""
-        bar = HealthBar(max_value=100.0, width=100)
-
-        # Above threshold should be green
-        bar.update(current_value=40.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_GREEN)
-
-        # At/below threshold (0 < val <= 30) should be Orange (Low Health)
-        bar.update(current_value=30.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_HEALTH_LOW)
-
-    def test_health_bar_color_change_just_above_threshold(self) -> None:
-        """Test color change just above low health threshold."""
-        bar = HealthBar(max_value=100.0, width=100)
-
-        # Just above threshold (30.1)
-        bar.update(current_value=30.1, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_GREEN)
-
-        # At threshold (30.0) -> Orange
-        bar.update(current_value=30.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_HEALTH_LOW)
-
-    def test_health_bar_clamps_above_max(self) -> None:
-        """Test that bar clamps values above max."""
-        bar = HealthBar(max_value=100.0, width=100)
-        bar.update(current_value=150.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 100)
-
-    def test_health_bar_clamps_below_zero(self) -> None:
-        """Test that bar clamps negative values."""
-        bar = HealthBar(max_value=100.0, width=100)
-        bar.update(current_value=-50.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 0)
-
-    def test_health_bar_initial_position(self) -> None:
-        """Test that the bar is initialized at the correct position."""
-        bar = HealthBar(x=100, y=200)
-
-        # Background should be offset by -2 due to border
-        self.assertEqual(bar.background.x, 98.0)
-        self.assertEqual(bar.background.y, 198.0)
-        # Foreground should be at exact position
-        self.assertEqual(bar.foreground.x, 100.0)
-        self.assertEqual(bar.foreground.y, 200.0)
-
-    def test_health_bar_update_position(self) -> None:
-        """Test that the bar position updates correctly."""
-        bar = HealthBar(x=0, y=0)
-        bar.update(50, 100, 200)
-
-        self.assertEqual(bar.background.x, 98.0)
-        self.assertEqual(bar.background.y, 198.0)
-        self.assertEqual(bar.foreground.x, 100.0)
-        self.assertEqual(bar.foreground.y, 200.0)
-
-    def test_health_bar_get_position(self) -> None:
-        """Test that get_position returns the background position."""
-        bar = HealthBar(x=100, y=200)
-        pos = bar.get_position()
-        self.assertEqual(pos, (98.0, 198.0))
-
-    def test_health_bar_get_position_after_update(self) -> None:
-        """Test get_position after update."""
-        bar = HealthBar(x=0, y=0)
-        bar.update(50, 75, 125)
-        pos = bar.get_position()
-        self.assertEqual(pos, (73.0, 123.0))
-
-    def test_health_bar_with_stamina_max(self) -> None:
-        """Test health bar with stamina max value."""
-        bar = HealthBar(max_value=CONFIG.MAX_STAMINA, width=100)
-        bar.update(current_value=CONFIG.MAX_STAMINA, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 100)
-
-    def test_health_bar_with_stamina_values(self) -> None:
-        """Test health bar with various stamina values."""
-        bar = HealthBar(max_value=CONFIG.MAX_STAMINA, width=100)
-
-        # 50% stamina
-        bar.update(current_value=50.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 50)
-
-        # 25% stamina
-        bar.update(current_value=25.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 25)
-
-    def test_health_bar_draw(self) -> None:
-        """Test that draw method can be called without error."""
-        with patch("pyglet.shapes.Rectangle.draw"):
-            bar = HealthBar()
-            bar.update(current_value=50.0, x=0.0, y=0.0)
-            # Should not raise an exception
-            bar.draw()
-
-    def test_health_bar_sequential_updates(self) -> None:
-        """Test multiple sequential updates."""
-        bar = HealthBar(max_value=100.0, width=100)
-
-        # Update 1: 100% health
-        bar.update(current_value=100.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 100)
-
-        # Update 2: 50% health
-        bar.update(current_value=50.0, x=10.0, y=10.0)
-        self.assertEqual(bar.foreground.width, 50)
-        self.assertEqual(bar.background.x, 8.0)
-
-        # Update 3: 10% health (below threshold) -> Orange
-        bar.update(current_value=10.0, x=20.0, y=20.0)
-        self.assertEqual(bar.foreground.width, 10)
-        self.assertEqual(bar.foreground.color[:3], CONFIG.COLOR_HEALTH_LOW)
-
-    def test_health_bar_precise_width_calculation(self) -> None:
-        """Test precise width calculation for various values."""
-        bar = HealthBar(max_value=100.0, width=200)
-
-        # Test 25%, 50%, 75%
-        bar.update(current_value=25.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 50)
-
-        bar.update(current_value=50.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 100)
-
-        bar.update(current_value=75.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 150)
-
-    def test_health_bar_with_odd_dimensions(self) -> None:
-        """Test health bar with non-standard dimensions."""
-        bar = HealthBar(max_value=77.0, width=77)
-        bar.update(current_value=77.0, x=0.0, y=0.0)
-        self.assertEqual(bar.foreground.width, 77)
-
-        bar.update(current_value=38.5, x=0.0, y=0.0)
-        self.assertAlmostEqual(bar.foreground.width, 38.5, places=1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+class _FakeRectangle:
+    """Stand-in for pyglet.shapes.Rectangle that stores geometry and color as given, no GL."""
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        color: tuple[int, ...] = (255, 255, 255, 255),
+        batch: object = None,
+        group: object = None,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = color
+        self.opacity = 255
+
+    def draw(self) -> None:
+        """Nothing to render."""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fake_rectangles() -> Iterator[None]:
+    """Swap in the fake Rectangle; the assertions only read geometry and color."""
+    with patch("pyglet.shapes.Rectangle", _FakeRectangle):
+        yield
+
+
+@pytest.fixture(scope="module")
+def bar_for(_fake_rectangles: None) -> Callable[[float, int], HealthBar]:
+    """One shared bar per (max_value, width).
+
+    update() rewrites every field these tests read (position, fill width and color), so
+    each test's first update fully replaces the state left by the previous one.
+    """
+    return cache(lambda max_value, width: HealthBar(max_value=max_value, width=width))
+
+
+def test_health_bar_creation_defaults() -> None:
+    """Test creating a health bar with default values."""
+    bar = HealthBar()
+    assert bar.max_value == CONFIG.MAX_HEALTH
+    assert bar.width == CONFIG.BAR_WIDTH
+    assert bar.height == CONFIG.BAR_HEIGHT
+
+
+def test_health_bar_creation_custom_values() -> None:
+    """Test creating a health bar with custom values."""
+    bar = HealthBar(max_value=200.0, width=100, height=10, x=50.0, y=75.0)
+    assert bar.max_value == 200.0
+    assert bar.width == 100
+    assert bar.height == 10
+
+
+@pytest.mark.parametrize(
+    ("max_value", "width", "value", "expected_width", "expected_color"),
+    [
+        pytest.param(100.0, 100, 100.0, 100, CONFIG.COLOR_GREEN, id="full"),
+        pytest.param(100.0, 100, 50.0, 50, CONFIG.COLOR_GREEN, id="half"),
+        pytest.param(100.0, 100, 0.0, 0, CONFIG.COLOR_RED, id="zero"),
+        pytest.param(100.0, 100, 40.0, 40, CONFIG.COLOR_GREEN, id="above_threshold"),
+        # Just above the low health threshold stays green; at it (0 < val <= 30) turns orange
+        pytest.param(100.0, 100, 30.1, None, CONFIG.COLOR_GREEN, id="just_above_threshold"),
+        pytest.param(100.0, 100, 30.0, 30, CONFIG.COLOR_HEALTH_LOW, id="at_threshold"),
+        pytest.param(100.0, 100, 150.0, 100, None, id="clamps_above_max"),
+        pytest.param(100.0, 100, -50.0, 0, None, id="clamps_below_zero"),
+        pytest.param(CONFIG.MAX_STAMINA, 100, CONFIG.MAX_STAMINA, 100, None, id="stamina_max"),
+        pytest.param(CONFIG.MAX_STAMINA, 100, 50.0, 50, None, id="stamina_half"),
+        pytest.param(CONFIG.MAX_STAMINA, 100, 25.0, 25, None, id="stamina_quarter"),
+        pytest.param(100.0, 200, 25.0, 50, None, id="wide_quarter"),
+        pytest.param(100.0, 200, 50.0, 100, None, id="wide_half"),
+        pytest.param(100.0, 200, 75.0, 150, None, id="wide_three_quarters"),
+        pytest.param(77.0, 77, 77.0, 77, None, id="odd_full"),
+    ],
+)
+def test_health_bar_update(
+    bar_for: Callable[[float, int], HealthBar],
+    max_value: float,
+    width: int,
+    value: float,
+    expected_width: int | None,
+    expected_color: Color | None,
+) -> None:
+    """A single update sets the fill width and threshold color for the value."""
+    bar = bar_for(max_value, width)
+
+    bar.update(current_value=value, x=0.0, y=0.0)
+
+    if expected_width is not None:
+        assert bar.foreground.width == expected_width
+    # The fake keeps the Color exactly as HealthBar assigned it
+    if expected_color is not None:
+        assert bar.foreground.color == expected_color
+
+
+def test_health_bar_initial_position() -> None:
+    """Test that the bar is initialized at the correct position."""
+    bar = HealthBar(x=100, y=200)
+
+    # Background should be offset by -2 due to border
+    assert bar.background.x == 98.0
+    assert bar.background.y == 198.0
+    # Foreground should be at exact position
+    assert bar.foreground.x == 100.0
+    assert bar.foreground.y == 200.0
+
+
+def test_health_bar_update_position() -> None:
+    """Test that the bar position updates correctly."""
+    bar = HealthBar(x=0, y=0)
+    bar.update(50, 100, 200)
+
+    assert bar.background.x == 98.0
+    assert bar.background.y == 198.0
+    assert bar.foreground.x == 100.0
+    assert bar.foreground.y == 200.0
+
+
+def test_health_bar_get_position() -> None:
+    """Test that get_position returns the background position."""
+    bar = HealthBar(x=100, y=200)
+    assert bar.get_position() == (98.0, 198.0)
+
+
+def test_health_bar_get_position_after_update() -> None:
+    """Test get_position after update."""
+    bar = HealthBar(x=0, y=0)
+    bar.update(50, 75, 125)
+    assert bar.get_position() == (73.0, 123.0)
+
+
+def test_health_bar_draw() -> None:
+    """Test that draw method can be called without error."""
+    bar = HealthBar()
+    bar.update(current_value=50.0, x=0.0, y=0.0)
+    # Should not raise an exception
+    bar.draw()
+
+
+def test_health_bar_sequential_updates(bar_for: Callable[[float, int], HealthBar]) -> None:
+    """Test multiple sequential updates."""
+    bar = bar_for(100.0, 100)
+
+    # Update 1: 100% health
+    bar.update(current_value=100.0, x=0.0, y=0.0)
+    assert bar.foreground.width == 100
+
+    # Update 2: 50% health
+    bar.update(current_value=50.0, x=10.0, y=10.0)
+    assert bar.foreground.width == 50
+    assert bar.background.x == 8.0
+
+    # Update 3: 10% health (below threshold) -> Orange
+    bar.update(current_value=10.0, x=20.0, y=20.0)
+    assert bar.foreground.width == 10
+    assert bar.foreground.color == CONFIG.COLOR_HEALTH_LOW
+
+
+def test_health_bar_odd_dimensions_half_fill(bar_for: Callable[[float, int], HealthBar]) -> None:
+    """Test a non-standard bar size fills proportionally at half value."""
+    bar = bar_for(77.0, 77)
+
+    bar.update(current_value=38.5, x=0.0, y=0.0)
+
+    assert bar.foreground.width == pytest.approx(38.5, abs=0.05)
@@ -1,5 +1,8 @@
-import logging
-from unittest.mock import MagicMock
+import hashlib
+import io
+import struct
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from chaser_game.restore_assets import (
@@ -8,34 +11,61 @@ from chaser_game.restore_assets import (
     verify_audio_metadata,
     verify_image_metadata,
 )
+from PIL import Image
+
+
+def _png_bytes() -> bytes:
+    """Encode a small valid 100x100 red PNG."""
+    buf = io.BytesIO()
+    Image.new("RGB", (100, 100), color="red").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+_PNG_BYTES = _png_bytes()
+_PNG_SHA256 = hashlib.sha256(_PNG_BYTES).hexdigest().upper()
+
+_WAV_RATE = 44100
+_WAV_DATA_SIZE = _WAV_RATE * 2  # mono, 2 bytes per sample
+_WAV_HEADER = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF",
+    36 + _WAV_DATA_SIZE,
+    b"WAVE",
+    b"fmt ",
+    16,  # fmt chunk size
+    1,  # PCM
+    1,  # channels
+    _WAV_RATE,
+    _WAV_RATE * 2,  # byte rate
+    2,  # block align
+    16,  # bits per sample
+    b"data",
+    _WAV_DATA_SIZE,
+)
 
 
 @pytest.fixture
 def mock_logger():
-    return MagicMock(spec=logging.Logger)
-
+    # Only the logging methods the verifiers call; any other attribute raises AttributeError
+    return SimpleNamespace(debug=Mock(), info=Mock(), warning=Mock(), error=Mock())
 
-@pytest.fixture
-def temp_image_file(tmp_path):
-    p = tmp_path / "test.png"
-    # Create a small valid PNG
-    from PIL import Image
 
-    img = Image.new("RGB", (100, 100), color="red")
-    img.save(p)
+# The metadata and hash checks only read these files, so each is written once per module
+@pytest.fixture(scope="module")
+def temp_image_file(tmp_path_factory):
+    p = tmp_path_factory.mktemp("assets") / "test.png"
+    p.write_bytes(_PNG_BYTES)
     return p
 
 
-@pytest.fixture
-def temp_audio_file(tmp_path):
-    p = tmp_path / "test.wav"
-    import wave
-
-    with wave.open(str(p), "wb") as wav:
-        wav.setnchannels(1)
-        wav.setsampwidth(2)
-        wav.setframerate(44100)
-        wav.writeframes(b"\x00" * 44100 * 2)  # 1 sec silence (2 bytes per sample)
+@pytest.fixture(scope="module")
+def temp_audio_file(tmp_path_factory):
+    p = tmp_path_factory.mktemp("assets") / "test.wav"
+    # 1 sec of mono 16-bit silence: write the PCM header, then extend the file with a hole
+    # for the sample data instead of building the zero bytes in memory
+    with open(p, "wb") as f:
+        f.write(_WAV_HEADER)
+        f.truncate(len(_WAV_HEADER) + _WAV_DATA_SIZE)
     return p
 
 
@@ -51,32 +81,32 @@ def test_calculate_sha256(tmp_path):
 def test_verify_image_metadata_success(temp_image_file, mock_logger):
     cfg = {"dimensions": [100, 100], "format": "PNG"}
     assert verify_image_metadata(temp_image_file, cfg, mock_logger)
-    mock_logger.error.assert_not_called()
+    assert not mock_logger.error.called
 
 
 def test_verify_image_metadata_fail_dims(temp_image_file, mock_logger):
     cfg = {"dimensions": [200, 200], "format": "PNG"}
     assert not verify_image_metadata(temp_image_file, cfg, mock_logger)
-    mock_logger.error.assert_called()
+    assert mock_logger.error.called
 
 
 def test_verify_image_metadata_fail_format(temp_image_file, mock_logger):
     # It is PNG, expect JPEG
     cfg = {"dimensions": [100, 100], "format": "JPEG"}
     assert not verify_image_metadata(temp_image_file, cfg, mock_logger)
-    mock_logger.error.assert_called()
+    assert mock_logger.error.called
 
 
 def test_verify_audio_metadata_success(temp_audio_file, mock_logger):
     cfg = {"channels": 1, "sample_rate": 44100, "duration_seconds": 1.0}
     assert verify_audio_metadata(temp_audio_file, cfg, mock_logger)
-    mock_logger.error.assert_not_called()
+    assert not mock_logger.error.called
 
 
 def test_verify_audio_metadata_fail(temp_audio_file, mock_logger):
     cfg = {"channels": 2}  # File is mono
     assert not verify_audio_metadata(temp_audio_file, cfg, mock_logger)
-    mock_logger.error.assert_called()
+    assert mock_logger.error.called
 
 
 def test_verify_asset_integrity_hash_mismatch(temp_image_file, mock_logger):
@@ -88,7 +118,5 @@ def test_verify_asset_integrity_hash_mismatch(temp_image_file, mock_logger):
 
 
 def test_verify_asset_integrity_full_pass(temp_image_file, mock_logger):
-    # Calculate real hash
-    real_hash = calculate_sha256(temp_image_file)
-    cfg = {"sha256": real_hash, "dimensions": [100, 100], "format": "PNG"}
+    cfg = {"sha256": _PNG_SHA256, "dimensions": [100, 100], "format": "PNG"}
     assert verify_asset_integrity(temp_image_file, cfg, "sprite", mock_logger)